@@ -0,0 +1,138 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+
+from parse_file import extract_text_auto
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONCURRENCY = 4
+_KILL_GRACE = 1.0
+
+# forkserver children are forked from a clean single-threaded server, so it
+# is safe to start them from an event loop that already runs threads. They
+# re-import __main__, so readers registered at import time are available.
+_START_METHOD = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+
+
+def _child_main(conn, file_path: str, options: dict):
+    try:
+        result = ("ok", extract_text_auto(file_path, **options))
+    except Exception as e:
+        result = ("error", e)
+    try:
+        conn.send(result)
+    except Exception as e:  # unpicklable exception
+        conn.send(("error", RuntimeError(f"{type(result[1]).__name__}: {e}")))
+    finally:
+        conn.close()
+
+
+def _extract_isolated(file_path: str, timeout: float, options: dict) -> Tuple[str, str]:
+    """
+    Parses one file in a dedicated child process and kills it if no result
+    arrives within `timeout` seconds, so a PDF that makes PyPDF2 spin cannot
+    hold a worker forever.
+    """
+    ctx = multiprocessing.get_context(_START_METHOD)
+    receiver, sender = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_child_main, args=(sender, file_path, options), daemon=True)
+    process.start()
+    sender.close()
+    try:
+        if not receiver.poll(timeout):
+            process.kill()
+            raise TimeoutError(f"Parsing {file_path} exceeded {timeout:.1f}s; worker killed")
+        try:
+            status, payload = receiver.recv()
+        except EOFError:
+            raise RuntimeError(f"Worker for {file_path} exited with code {process.exitcode}") from None
+    finally:
+        receiver.close()
+        process.join(_KILL_GRACE)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    if status == "error":
+        raise payload
+    return payload
+
+
+class AsyncExtractor:
+    """
+    Async counterpart of `extract_text_auto` for use from an event loop.
+
+    At most `max_concurrency` files are parsed at once (a semaphore caps the
+    in-flight count); each is parsed in its own child process with a
+    per-file `timeout`. Extra keyword arguments are passed to
+    `extract_text_auto` (cache, docx_reader, page options).
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 timeout: float = DEFAULT_TIMEOUT, **extract_options):
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.extract_options = extract_options
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._threads = ThreadPoolExecutor(max_workers=max_concurrency,
+                                           thread_name_prefix="async-ingest")
+
+    async def extract(self, file_path: str, timeout: Optional[float] = None) -> Tuple[str, str]:
+        """
+        Returns tuple of (raw_text, cleaned_text). Raises TimeoutError when
+        the file takes longer than the timeout.
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        timeout = self.timeout if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(
+                self._threads, _extract_isolated, file_path, timeout, self.extract_options
+            )
+
+    async def extract_many(self, file_paths: Sequence[str]) -> List[Union[Tuple[str, str], BaseException]]:
+        """
+        Returns one entry per path, in order: the (raw_text, cleaned_text)
+        tuple, or the exception raised for that file.
+        """
+        return await asyncio.gather(*(self.extract(path) for path in file_paths),
+                                    return_exceptions=True)
+
+    def close(self):
+        self._threads.shutdown(wait=False, cancel_futures=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+
+async def extract_text_auto_async(file_path: str, timeout: float = DEFAULT_TIMEOUT,
+                                  **extract_options) -> Tuple[str, str]:
+    """
+    One-off async `extract_text_auto` with a timeout. For many files, share
+    an AsyncExtractor so the concurrency cap applies across calls.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, _extract_isolated, file_path, timeout, extract_options)
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    input_dir = os.path.join(os.path.dirname(__file__), "inputs")
+    paths = sys.argv[1:] or [os.path.join(input_dir, name) for name in sorted(os.listdir(input_dir))]
+
+    async def main():
+        async with AsyncExtractor() as extractor:
+            for path, result in zip(paths, await extractor.extract_many(paths)):
+                if isinstance(result, BaseException):
+                    print(f"❌ {os.path.basename(path)}: {result}")
+                else:
+                    print(f"✅ {os.path.basename(path)}: {len(result[1])} chars")
+
+    asyncio.run(main())
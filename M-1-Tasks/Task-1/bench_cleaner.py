@@ -0,0 +1,66 @@
+# Task-1/bench_cleaner.py
+"""
+Benchmark: step-by-step chain_clean vs. the fused basic_clean.
+
+Checks that both produce identical output (on the Task-1 inputs, a large
+synthetic document and random fuzz strings) before timing them.
+
+    python bench_cleaner.py [--copies 2000] [--repeat 5]
+"""
+import argparse
+import os
+import random
+import time
+
+from text_cleaner import basic_clean, chain_clean
+
+BASE_DIR = os.path.dirname(__file__)
+INPUT_DIR = os.path.join(BASE_DIR, "inputs")
+
+FUZZ_ALPHABET = [
+    "a", "w", "h", "t", ":", "/", ".", "@", "-", "\n", "\r", " ", "\t",
+    "\u00a0", "com", "www.", "http://", "https://", "x@y.com", "1", "_", "+",
+]
+
+
+def build_document(copies: int) -> str:
+    jd_path = os.path.join(INPUT_DIR, "JD.txt")
+    with open(jd_path, "r", encoding="utf-8") as f:
+        jd_text = f.read()
+    contact = "Contact: jane.doe@example.com | https://linkedin.com/in/jane | Data-\nAnalyst\n"
+    return (jd_text + contact) * copies
+
+
+def check_equivalence(document: str, fuzz_cases: int = 100000):
+    assert basic_clean(document) == chain_clean(document), "outputs differ on document"
+    rng = random.Random(0)
+    for _ in range(fuzz_cases):
+        sample = "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 30)))
+        assert basic_clean(sample) == chain_clean(sample), f"outputs differ on {sample!r}"
+
+
+def time_it(func, text: str, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--copies", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    document = build_document(args.copies)
+    check_equivalence(document)
+    print(f"✅ Identical output ({len(document):,} chars + fuzz cases)")
+
+    chain_time = time_it(chain_clean, document, args.repeat)
+    fused_time = time_it(basic_clean, document, args.repeat)
+    mb = len(document) / 1e6
+    print(f"chain_clean : {chain_time * 1000:8.1f} ms  ({mb / chain_time:6.1f} MB/s)")
+    print(f"basic_clean : {fused_time * 1000:8.1f} ms  ({mb / fused_time:6.1f} MB/s)")
+    print(f"Speedup     : {chain_time / fused_time:.2f}x")
@@ -0,0 +1,101 @@
+# Task-1/bench_docx.py
+"""
+Benchmark: python-docx read_docx vs. the streaming read_docx_stream.
+
+Times both readers and records peak Python memory (tracemalloc) on the
+given .docx files. With --synthetic N, a document with N paragraphs and
+N/10 small tables is generated first.
+
+    python bench_docx.py [files ...] [--synthetic 20000] [--repeat 3]
+"""
+import argparse
+import glob
+import os
+import time
+import tracemalloc
+import zipfile
+from xml.sax.saxutils import escape
+
+from file_reader_doc import read_docx
+from file_reader_docx_stream import read_docx_stream
+
+BASE_DIR = os.path.dirname(__file__)
+INPUT_DIR = os.path.join(BASE_DIR, "inputs")
+
+CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/'
+    '2006/relationships/officeDocument" Target="word/document.xml"/>'
+    '</Relationships>'
+)
+
+
+def _paragraph(text: str) -> str:
+    return f"<w:p><w:r><w:t xml:space=\"preserve\">{escape(text)}</w:t></w:r></w:p>"
+
+
+def write_synthetic_docx(path: str, paragraphs: int):
+    body = []
+    for i in range(paragraphs):
+        body.append(_paragraph(f"Paragraph {i}: Python, SQL, Tableau and data analysis experience."))
+        if i % 10 == 0:
+            cells = "".join(f"<w:tc>{_paragraph(f'Cell {i}.{c}')}</w:tc>" for c in range(3))
+            body.append(f"<w:tbl><w:tr>{cells}</w:tr></w:tbl>")
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        f"<w:body>{''.join(body)}</w:body></w:document>"
+    )
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr("_rels/.rels", ROOT_RELS)
+        archive.writestr("word/document.xml", document)
+
+
+def measure(reader, path: str, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        text = reader(path)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    reader(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, len(text)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("files", nargs="*")
+    parser.add_argument("--synthetic", type=int, default=0,
+                        help="Also benchmark a generated document with this many paragraphs")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(INPUT_DIR, "*.docx")))
+    if args.synthetic:
+        synthetic_path = os.path.join(BASE_DIR, f"synthetic_{args.synthetic}.docx")
+        write_synthetic_docx(synthetic_path, args.synthetic)
+        files.append(synthetic_path)
+
+    readers = [("python-docx", read_docx), ("stream", read_docx_stream)]
+    for path in files:
+        print(f"\n📄 {os.path.basename(path)} ({os.path.getsize(path) / 1024:.0f} KB)")
+        for name, reader in readers:
+            seconds, peak, chars = measure(reader, path, args.repeat)
+            print(f"  {name:<12} {seconds * 1000:9.1f} ms   peak {peak / 1e6:7.2f} MB   {chars:,} chars")
+
+    if args.synthetic:
+        os.remove(synthetic_path)
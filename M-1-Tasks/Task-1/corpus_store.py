@@ -0,0 +1,192 @@
+import json
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, List, Optional, Sequence
+
+# corpus.idx = 8-byte magic + one fixed-size record per document:
+#   sha256 (32 bytes) + (offset, length) into corpus.blob for each text column
+# corpus.blob = the UTF-8 bytes of every text column, back to back.
+# "sections" holds the document's section index (section_index.py) as JSON.
+INDEX_MAGIC = b"SGCORP02"
+TEXT_COLUMNS = ("source", "raw", "cleaned", "sections")
+COLUMNS = ("doc_id", "sha256") + TEXT_COLUMNS
+_RECORD = struct.Struct("<32s" + "QQ" * len(TEXT_COLUMNS))
+INDEX_NAME = "corpus.idx"
+BLOB_NAME = "corpus.blob"
+
+
+class CorpusWriter:
+    """
+    Append-only writer. A document's blob bytes are written before its index
+    record, so a crash can leave unreferenced blob bytes or a torn trailing
+    index record, but never a whole record pointing past the end of the
+    blob. Opening the writer truncates both files back to the last whole
+    record, so appends after a crash start on a record boundary.
+    """
+
+    def __init__(self, corpus_dir: str):
+        os.makedirs(corpus_dir, exist_ok=True)
+        index_path = os.path.join(corpus_dir, INDEX_NAME)
+        self._index = open(index_path, "ab")
+        self._blob = open(os.path.join(corpus_dir, BLOB_NAME), "ab")
+        index_size = self._index.seek(0, os.SEEK_END)
+        if index_size >= len(INDEX_MAGIC):
+            with open(index_path, "rb") as f:
+                if f.read(len(INDEX_MAGIC)) != INDEX_MAGIC:
+                    self.close()
+                    raise ValueError(f"Not a corpus index, or written by an older version: {corpus_dir}")
+        if index_size < len(INDEX_MAGIC):
+            # Empty, or torn before the magic was complete
+            self._index.truncate(0)
+            self._index.write(INDEX_MAGIC)
+            index_size = len(INDEX_MAGIC)
+        self._count = (index_size - len(INDEX_MAGIC)) // _RECORD.size
+        self._index.truncate(len(INDEX_MAGIC) + self._count * _RECORD.size)
+        self._blob_size = self._last_record_end(index_path)
+        self._blob.truncate(self._blob_size)
+
+    def _last_record_end(self, index_path: str) -> int:
+        if not self._count:
+            return 0
+        self._index.flush()
+        with open(index_path, "rb") as f:
+            f.seek(len(INDEX_MAGIC) + (self._count - 1) * _RECORD.size)
+            record = _RECORD.unpack(f.read(_RECORD.size))
+        # Columns are written in order, so the last span ends the record
+        return record[-2] + record[-1]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, source: str, sha256_hex: str, raw: str, cleaned: str,
+               sections: Sequence[dict] = ()) -> int:
+        """
+        Args:
+            sections: Section index of `cleaned` (build_section_index)
+
+        Returns:
+            int: The new document's id (its position in the corpus)
+        """
+        spans = []
+        for value in (source, raw, cleaned, json.dumps(list(sections))):
+            data = value.encode("utf-8")
+            self._blob.write(data)
+            spans.extend((self._blob_size, len(data)))
+            self._blob_size += len(data)
+        self._blob.flush()
+        self._index.write(_RECORD.pack(bytes.fromhex(sha256_hex), *spans))
+        self._index.flush()
+        self._count += 1
+        return self._count - 1
+
+    def close(self):
+        self._blob.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class CorpusReader:
+    """
+    Random access by doc id and batch scans over a memory-mapped corpus.
+    `view()` and `scan()` return memoryviews into the mapping (no copy);
+    release them before calling `close()`.
+    """
+
+    def __init__(self, corpus_dir: str):
+        with open(os.path.join(corpus_dir, INDEX_NAME), "rb") as f:
+            self._index = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._index[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"Not a corpus index, or written by an older version: {corpus_dir}")
+        with open(os.path.join(corpus_dir, BLOB_NAME), "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._blob_view = memoryview(self._blob)
+        self._count = (len(self._index) - len(INDEX_MAGIC)) // _RECORD.size
+        self._by_source: Optional[Dict[str, int]] = None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, doc_id: int):
+        if not 0 <= doc_id < self._count:
+            raise IndexError(f"doc_id {doc_id} out of range (corpus has {self._count} documents)")
+        return _RECORD.unpack_from(self._index, len(INDEX_MAGIC) + doc_id * _RECORD.size)
+
+    def view(self, doc_id: int, column: str) -> memoryview:
+        """
+        Returns:
+            memoryview: The column's UTF-8 bytes, without copying
+        """
+        record = self._record(doc_id)
+        position = TEXT_COLUMNS.index(column)
+        offset, length = record[1 + 2 * position], record[2 + 2 * position]
+        return self._blob_view[offset:offset + length]
+
+    def get(self, doc_id: int) -> dict:
+        record = self._record(doc_id)
+        document = {"doc_id": doc_id, "sha256": record[0].hex()}
+        for position, column in enumerate(TEXT_COLUMNS):
+            offset, length = record[1 + 2 * position], record[2 + 2 * position]
+            document[column] = str(self._blob_view[offset:offset + length], "utf-8")
+        document["sections"] = json.loads(document["sections"])
+        return document
+
+    def sections(self, doc_id: int) -> List[dict]:
+        """
+        Returns:
+            list: The document's section index, offsets into its cleaned text
+        """
+        return json.loads(str(self.view(doc_id, "sections"), "utf-8"))
+
+    def find(self, source: str) -> Optional[int]:
+        """
+        Returns:
+            int: Id of the most recently appended document for `source`
+        """
+        if self._by_source is None:
+            self._by_source = {
+                str(self.view(doc_id, "source"), "utf-8"): doc_id for doc_id in range(self._count)
+            }
+        return self._by_source.get(source)
+
+    def scan(self, columns: Sequence[str] = ("cleaned",), batch_size: int = 1024,
+             decode: bool = False) -> Iterator[Dict[str, List]]:
+        """
+        Yields batches as {column: [values]} plus "doc_id". Text columns are
+        zero-copy memoryviews unless `decode` is set; "sections" stays JSON
+        text either way (see sections()).
+        """
+        for column in columns:
+            if column not in COLUMNS:
+                raise ValueError(f"Unknown column: {column}")
+        for batch_start in range(0, self._count, batch_size):
+            doc_ids = range(batch_start, min(batch_start + batch_size, self._count))
+            batch = {"doc_id": list(doc_ids)}
+            for column in columns:
+                if column == "doc_id":
+                    continue
+                if column == "sha256":
+                    batch[column] = [self._record(doc_id)[0].hex() for doc_id in doc_ids]
+                elif decode:
+                    batch[column] = [str(self.view(doc_id, column), "utf-8") for doc_id in doc_ids]
+                else:
+                    batch[column] = [self.view(doc_id, column) for doc_id in doc_ids]
+            yield batch
+
+    def close(self):
+        self._blob_view.release()
+        if isinstance(self._blob, mmap.mmap):
+            self._blob.close()
+        self._index.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -1,16 +1,11 @@
-import os
-
 def read_txt(file_path):
     """
     Returns:
         str: Extracted text content from TXT file
     """
     try:
-        print("Looking for file at:", os.path.abspath(file_path))
-        print("File exists:", os.path.exists(file_path))
         with open(file_path, "r", encoding="utf-8") as f:
             text = f.read()
-        print("✅ Successfully read TXT file")
         return text
 
     except FileNotFoundError:
@@ -9,7 +9,6 @@ def read_docx(file_path):
     try:
         doc = docx.Document(file_path)
         text = "\n".join([para.text for para in doc.paragraphs])
-        print("Successfully read DOCX file")
         return text
 
     except FileNotFoundError:
@@ -0,0 +1,85 @@
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import Iterator
+
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+PARAGRAPH = W_NS + "p"
+BODY = W_NS + "body"
+TEXT = W_NS + "t"
+# Run-level elements that python-docx's Run.text renders as characters
+RUN_CHARS = {
+    W_NS + "tab": "\t",
+    W_NS + "ptab": "\t",
+    W_NS + "br": "\n",
+    W_NS + "cr": "\n",
+    W_NS + "noBreakHyphen": "-",
+}
+
+
+def iter_docx_paragraphs(file_path: str) -> Iterator[str]:
+    """
+    Yields paragraph text in document order straight from word/document.xml,
+    without building the python-docx object model. Paragraphs inside table
+    cells are included; mc:Fallback copies of text boxes are skipped so
+    their text is not duplicated.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        with archive.open("word/document.xml") as xml_file:
+            body = None
+            depth = 0
+            fallback_depth = 0
+            open_paragraphs = []
+
+            for event, elem in ET.iterparse(xml_file, events=("start", "end")):
+                tag = elem.tag
+                if event == "start":
+                    depth += 1
+                    if tag == BODY:
+                        body = elem
+                    elif tag == MC_FALLBACK:
+                        fallback_depth += 1
+                    elif tag == PARAGRAPH and not fallback_depth:
+                        open_paragraphs.append([])
+                    continue
+
+                depth -= 1
+                if tag == MC_FALLBACK:
+                    fallback_depth -= 1
+                elif fallback_depth or not open_paragraphs:
+                    pass
+                elif tag == TEXT:
+                    open_paragraphs[-1].append(elem.text or "")
+                elif tag in RUN_CHARS:
+                    open_paragraphs[-1].append(RUN_CHARS[tag])
+                elif tag == PARAGRAPH:
+                    yield "".join(open_paragraphs.pop())
+
+                # Children of <w:body> are finished; drop them to bound memory.
+                if body is not None and depth == 2:
+                    body.clear()
+
+
+def read_docx_stream(file_path):
+    """
+    Returns:
+        str: Extracted text content from DOCX file, paragraphs joined by newlines
+    """
+    try:
+        text = "\n".join(iter_docx_paragraphs(file_path))
+        return text
+
+    except FileNotFoundError:
+        print("❌ DOCX file not found")
+        return ""
+
+    except Exception as e:
+        print(f"❌ Error reading DOCX file: {e}")
+        return ""
+
+
+if __name__ == "__main__":
+    docx_content = read_docx_stream("sample_resume_doc.docx")
+    print("\nDOCX Content Preview:")
+    print(docx_content[:200] + "..." if len(docx_content) > 200 else docx_content)
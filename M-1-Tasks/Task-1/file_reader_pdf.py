@@ -1,18 +1,54 @@
 import PyPDF2
+from typing import Iterator, Optional, Tuple
 
-def read_pdf(file_path):
+from text_cleaner import PAGE_SEPARATOR
+
+
+def iter_pdf_pages(
+    file_path: str,
+    start_page: int = 0,
+    end_page: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    max_chars: Optional[int] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yields (page_number, page_text) one page at a time.
+
+    Args:
+        start_page: First page to read (0-based)
+        end_page: Stop before this page (exclusive), None for the last page
+        max_pages: Stop after this many pages have been yielded
+        max_chars: Stop once this many characters have been yielded; the
+            last page is truncated so the total never exceeds the limit
+    """
+    with open(file_path, 'rb') as file:
+        reader = PyPDF2.PdfReader(file)
+        total = len(reader.pages)
+        stop = total if end_page is None else min(end_page, total)
+        yielded_pages = 0
+        yielded_chars = 0
+        for page_number in range(start_page, stop):
+            if max_pages is not None and yielded_pages >= max_pages:
+                return
+            text = reader.pages[page_number].extract_text() or ""
+            if max_chars is not None:
+                remaining = max_chars - yielded_chars
+                if remaining <= 0:
+                    return
+                text = text[:remaining]
+            yielded_pages += 1
+            yielded_chars += len(text)
+            yield page_number, text
+
+
+def read_pdf(file_path, **page_options):
     """
     Returns:
         str: Extracted text content from PDF
     """
     try:
-        with open(file_path, 'rb') as file:
-            reader = PyPDF2.PdfReader(file)
-            text = ""
-            for page in reader.pages:
-                text += page.extract_text() or ""
-            print("Successfully read PDF file")
-            return text
+        text = PAGE_SEPARATOR.join(page_text for _, page_text in iter_pdf_pages(file_path, **page_options))
+        return text
 
     except FileNotFoundError:
         print("❌ PDF file not found")
@@ -25,4 +61,4 @@ def read_pdf(file_path):
 if __name__ == "__main__":
     pdf_content = read_pdf("sample_resume_pdf.pdf")
     print("\nPDF Content Preview:")
-    print(pdf_content[:200] + "..." if len(pdf_content) > 200 else pdf_content)
\ No newline at end of file
+    print(pdf_content[:200] + "..." if len(pdf_content) > 200 else pdf_content)
@@ -0,0 +1,114 @@
+import json
+import os
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from parse_cache import file_digest
+
+MANIFEST_NAME = ".manifest.json"
+
+
+def _remove_outputs(entry: dict) -> List[str]:
+    removed = []
+    for path in [entry["output"]] + entry.get("sidecars", []):
+        if os.path.exists(path):
+            os.remove(path)
+            removed.append(path)
+    return removed
+
+
+class Manifest:
+    """
+    Records, for each input file, the size, mtime and content hash it had
+    when it was last parsed, plus the output written for it. Used by the
+    incremental batch mode to skip unchanged inputs.
+
+    A file whose size and mtime are unchanged is trusted without hashing;
+    if only the mtime moved, the hash decides (e.g. after a plain `touch`).
+    `settings` (cleaner version, DOCX reader, ...) are stored in the header;
+    when they differ from the last run every input is parsed again.
+    """
+
+    def __init__(self, path: str, settings: Optional[dict] = None):
+        self.path = path
+        self.settings = settings or {}
+        self.entries: Dict[str, dict] = {}
+        self.settings_changed = False
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return
+        self.entries = data.get("files", {})
+        self.settings_changed = bool(self.entries) and data.get("settings", {}) != self.settings
+
+    @classmethod
+    def for_output_dir(cls, output_dir: str, settings: Optional[dict] = None) -> "Manifest":
+        return cls(os.path.join(output_dir, MANIFEST_NAME), settings)
+
+    def plan(self, input_paths: List[str]) -> Tuple[List[Tuple[str, str]], int]:
+        """
+        Returns:
+            tuple: ([(input_path, sha256)] that need parsing, number skipped)
+        """
+        todo = []
+        skipped = 0
+        for path in input_paths:
+            key = os.path.abspath(path)
+            stat = os.stat(path)
+            entry = None if self.settings_changed else self.entries.get(key)
+            output_present = entry is not None and os.path.exists(entry["output"])
+
+            if output_present and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                skipped += 1
+                continue
+
+            digest = file_digest(path)
+            if output_present and entry["sha256"] == digest:
+                entry["size"] = stat.st_size
+                entry["mtime_ns"] = stat.st_mtime_ns
+                skipped += 1
+                continue
+            todo.append((path, digest))
+        return todo, skipped
+
+    def record(self, input_path: str, digest: str, output_path: str,
+               sidecars: Sequence[str] = ()):
+        stat = os.stat(input_path)
+        self.entries[os.path.abspath(input_path)] = {
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest,
+            "output": os.path.abspath(output_path),
+            "sidecars": [os.path.abspath(path) for path in sidecars],
+        }
+
+    def forget(self, input_path: str) -> List[str]:
+        """
+        Drops the entry of an input that could not be parsed again, and
+        deletes its previous output and sidecars, which no longer match it.
+
+        Returns:
+            list: Output paths that were removed
+        """
+        entry = self.entries.pop(os.path.abspath(input_path), None)
+        return [] if entry is None else _remove_outputs(entry)
+
+    def prune_removed(self) -> List[str]:
+        """
+        Deletes outputs (and their sidecar files) whose input file no longer
+        exists.
+
+        Returns:
+            list: Output paths that were removed
+        """
+        removed = []
+        for key in [k for k in self.entries if not os.path.exists(k)]:
+            removed.extend(_remove_outputs(self.entries.pop(key)))
+        return removed
+
+    def save(self):
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "settings": self.settings, "files": self.entries}, f,
+                      indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
@@ -1,23 +1,337 @@
 # Task-1/parse_and_clean.py
+import argparse
+import glob
 import os
-from parse_file import extract_text_auto
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, List, Optional, Tuple
+
+import ingest_metrics
+from corpus_store import CorpusWriter
+from ingest_manifest import Manifest
+from parse_cache import ParseCache, file_digest
+from parse_file import DOCX_READERS, SUPPORTED_EXTENSIONS, extract_text_auto
+from section_index import SECTION_INDEX_VERSION, build_section_index, save_section_index
+from text_cleaner import CLEANER_VERSION
 
 BASE_DIR = os.path.dirname(__file__)
 INPUT_DIR = os.path.join(BASE_DIR, "inputs")
 OUTPUT_DIR = os.path.join(BASE_DIR, "outputs")
 
+
+def sections_path(out_path: str) -> str:
+    """
+    Returns:
+        str: Path of the section index written next to a *_parsed.txt output
+    """
+    base = out_path[:-len("_parsed.txt")] if out_path.endswith("_parsed.txt") else os.path.splitext(out_path)[0]
+    return base + "_sections.json"
+
+
+def save_output(out_path: str, cleaned: str, sections: List[dict]) -> str:
+    """
+    Writes the cleaned text and its section index (offsets into that text,
+    from build_section_index(cleaned, raw_text)).
+
+    Returns:
+        str: Path of the section index file
+    """
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(cleaned)
+    index_path = sections_path(out_path)
+    save_section_index(sections, index_path)
+    return index_path
+
+
 def parse_and_save(input_file, output_file):
     raw, cleaned = extract_text_auto(os.path.join(INPUT_DIR, input_file))
     out_path = os.path.join(OUTPUT_DIR, output_file)
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write(cleaned)
+    save_output(out_path, cleaned, build_section_index(cleaned, raw))
     print(f"✅ Saved: {out_path}")
 
+
+# -----------------------
+# Batch mode
+# -----------------------
+def collect_inputs(source: str) -> List[str]:
+    """
+    Returns:
+        list: Supported files under a directory (recursive) or matching a glob
+    """
+    if os.path.isdir(source):
+        pattern = os.path.join(source, "**", "*")
+    else:
+        pattern = source
+    files = [
+        path for path in glob.glob(pattern, recursive=True)
+        if os.path.isfile(path)
+        and os.path.splitext(path.lower())[1] in SUPPORTED_EXTENSIONS
+    ]
+    return sorted(files)
+
+
+def input_root(source: str, files: List[str]) -> str:
+    """
+    Returns:
+        str: The directory output names are made relative to: `source`
+        itself for a directory, the deepest common directory for a glob
+    """
+    if os.path.isdir(source):
+        return source
+    return os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in files]) if files else "."
+
+
+def output_name(input_path: str, root: str) -> str:
+    """
+    Keeps the extension and the path below `root`, so resume-1.pdf and
+    resume-1.docx (or two sub/resume.pdf files) never share an output:
+    inputs/sub/resume-1.pdf -> sub/resume-1.pdf_parsed.txt
+    """
+    relative = os.path.relpath(os.path.abspath(input_path), os.path.abspath(root))
+    return f"{relative}_parsed.txt"
+
+
+_worker_cache = None
+_worker_docx_reader = "python-docx"
+_worker_records = []
+_worker_keep_raw = False
+
+
+def _init_worker(cache_dir: Optional[str], docx_reader: str, collect_metrics: bool,
+                 keep_raw: bool):
+    global _worker_cache, _worker_docx_reader, _worker_keep_raw
+    # Workers only add entries; the parent enforces the size cap for all of them
+    _worker_cache = ParseCache(cache_dir, auto_evict=False) if cache_dir else None
+    _worker_docx_reader = docx_reader
+    _worker_keep_raw = keep_raw
+    if collect_metrics:
+        ingest_metrics.add_hook(_worker_records.append)
+
+
+def _failed(input_path: str, error: str) -> tuple:
+    return input_path, None, error, None, None, None
+
+
+def _parse_worker(input_path: str) -> Tuple[str, Optional[str], Optional[str], Optional[dict],
+                                            Optional[Tuple[str, str]], Optional[List[dict]]]:
+    """
+    Runs in a pool process. Returns (input_path, cleaned_text, error, metrics,
+    raw, sections), where metrics is the file's ParseRecord as a dict when
+    metrics are on, raw is (raw_text, sha256) when writing to a corpus, and
+    sections is the section index. The index needs the raw text's line
+    breaks, so it is built here rather than sending raw_text back.
+    """
+    _worker_records.clear()
+    try:
+        raw_text, cleaned = extract_text_auto(input_path, cache=_worker_cache,
+                                              docx_reader=_worker_docx_reader)
+        if not cleaned.strip():
+            # The readers print their own error and return "" instead of raising
+            return _failed(input_path, "No text extracted")
+        record = _worker_records[-1].to_dict() if _worker_records else None
+        raw = (raw_text, file_digest(input_path)) if _worker_keep_raw else None
+        return input_path, cleaned, None, record, raw, build_section_index(cleaned, raw_text)
+    except Exception as e:
+        return _failed(input_path, f"{type(e).__name__}: {e}")
+
+
+def _iter_parse_results(files: List[str], workers: int, initargs: tuple) -> Iterator[tuple]:
+    """
+    Runs _parse_worker over `files` on a process pool and yields each result
+    as it finishes. A worker that dies (OOM kill, crash in a native reader)
+    breaks the pool and fails every unfinished future. Those files are
+    retried in order on a fresh one-process pool, where the first file that
+    breaks it again is the one that crashed: it is yielded as failed and
+    the rest are retried again.
+    """
+    pending = list(files)
+    max_workers = min(workers, len(pending))
+    while pending:
+        broken = []
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                 initargs=initargs) as pool:
+            futures = {}
+            try:
+                for path in pending:
+                    futures[pool.submit(_parse_worker, path)] = path
+            except BrokenProcessPool:
+                broken.extend(pending[len(futures):])
+            for future in as_completed(futures):
+                try:
+                    yield future.result()
+                except BrokenProcessPool:
+                    broken.append(futures[future])
+                except Exception as e:
+                    yield _failed(futures[future], f"{type(e).__name__}: {e}")
+        if not broken:
+            return
+        order = {path: i for i, path in enumerate(pending)}
+        broken.sort(key=order.__getitem__)
+        if max_workers == 1:
+            yield _failed(broken.pop(0), "Worker process died")
+        elif broken:
+            print(f"⚠️ A worker process died; retrying {len(broken)} files one at a time")
+        pending = broken
+        max_workers = 1
+
+
+def parse_batch(source: str, output_dir: str = OUTPUT_DIR, workers: Optional[int] = None,
+                cache_dir: Optional[str] = None, docx_reader: str = "python-docx",
+                incremental: bool = False, metrics_jsonl: Optional[str] = None,
+                metrics_prom: Optional[str] = None, corpus_dir: Optional[str] = None):
+    """
+    Parses every supported file in `source` (directory or glob) on a process
+    pool and writes each output as soon as its worker finishes. With
+    `cache_dir`, files already parsed with the same contents are read from
+    the parse cache instead. With `incremental`, a manifest in `output_dir`
+    limits the run to new or changed inputs and deletes the outputs of
+    inputs that no longer exist or now fail to parse. Per-file metrics
+    (reader, bytes, pages, chars, parse/clean seconds) go to `metrics_jsonl`
+    as JSON lines and/or to `metrics_prom` as Prometheus text totals per
+    reader. With
+    `corpus_dir`, documents are appended to a single corpus store (source,
+    hash, raw and cleaned text, section index) instead of one .txt file
+    each.
+
+    Returns:
+        tuple: (number of files saved, list of (input_path, error))
+    """
+    if incremental and corpus_dir:
+        raise ValueError("The corpus store is append-only; it cannot be combined with incremental mode")
+
+    files = collect_inputs(source)
+    root = input_root(source, files)
+    manifest = None
+    if incremental:
+        # Prune first, so deleting every input still removes the stale outputs
+        manifest = Manifest.for_output_dir(output_dir, {"cleaner": CLEANER_VERSION,
+                                                        "sections": SECTION_INDEX_VERSION,
+                                                        "docx_reader": docx_reader})
+        for removed in manifest.prune_removed():
+            print(f"🗑️ Removed output of deleted input: {removed}")
+        if manifest.settings_changed:
+            print("♻️ Cleaner, section index or DOCX reader changed; re-parsing every input")
+    if not files:
+        print(f"❌ No supported files found for: {source}")
+        if manifest is not None and os.path.isdir(output_dir):
+            manifest.save()
+        return 0, []
+
+    if corpus_dir is None:
+        os.makedirs(output_dir, exist_ok=True)
+    digests = {}
+    if incremental:
+        todo, skipped = manifest.plan(files)
+        digests = dict(todo)
+        files = [path for path, _ in todo]
+        print(f"♻️ Unchanged: {skipped}   To parse: {len(files)}")
+        if not files:
+            manifest.save()
+            return 0, []
+
+    workers = workers or os.cpu_count() or 1
+    saved = 0
+    cache_hits = 0
+    failures = []
+    sinks = []
+    if metrics_jsonl:
+        sinks.append(ingest_metrics.JsonLinesSink(metrics_jsonl))
+    if metrics_prom:
+        prom_sink = ingest_metrics.PrometheusSink(metrics_prom)
+        sinks.append(prom_sink)
+    collect_metrics = bool(sinks) or bool(cache_dir)
+    corpus = CorpusWriter(corpus_dir) if corpus_dir else None
+    start = time.perf_counter()
+
+    initargs = (cache_dir, docx_reader, collect_metrics, corpus is not None)
+    for result in _iter_parse_results(files, workers, initargs):
+        input_path, cleaned, error, metrics, raw, sections = result
+        if metrics is not None:
+            record = ingest_metrics.ParseRecord.from_dict(metrics)
+            cache_hits += record.cache_hit
+            for sink in sinks:
+                sink(record)
+        if error is not None:
+            failures.append((input_path, error))
+            print(f"❌ Failed: {input_path} ({error})")
+            if manifest is not None:
+                for removed in manifest.forget(input_path):
+                    print(f"🗑️ Removed stale output of failed input: {removed}")
+            continue
+        if corpus is not None:
+            raw_text, digest = raw
+            corpus.append(os.path.abspath(input_path), digest, raw_text, cleaned, sections)
+            saved += 1
+            continue
+        out_path = os.path.join(output_dir, output_name(input_path, root))
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        index_path = save_output(out_path, cleaned, sections)
+        if manifest is not None:
+            manifest.record(input_path, digests[input_path], out_path, [index_path])
+        saved += 1
+
+    evicted = ParseCache(cache_dir).trim() if cache_dir else 0
+    if manifest is not None:
+        manifest.save()
+    if corpus is not None:
+        corpus.close()
+        print(f"🗄️ Corpus: {corpus_dir} ({len(corpus)} documents)")
+    if metrics_prom:
+        prom_sink.write()
+
+    elapsed = time.perf_counter() - start
+    rate = len(files) / elapsed if elapsed > 0 else float("inf")
+    print(f"\n📦 Processed {len(files)} files with {min(workers, len(files))} workers "
+          f"in {elapsed:.2f}s ({rate:.1f} files/sec)")
+    print(f"✅ Saved: {saved}   ❌ Failed: {len(failures)}")
+    if cache_dir:
+        print(f"🗃️ Cache hits: {cache_hits}/{len(files)}   Evicted: {evicted}")
+    return saved, failures
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Parse and clean resumes / JDs.")
+    parser.add_argument("source", nargs="?",
+                        help="Directory or glob of input files (batch mode)")
+    parser.add_argument("-o", "--output-dir", default=OUTPUT_DIR,
+                        help="Where to write *_parsed.txt files")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="Worker processes (default: number of CPU cores)")
+    parser.add_argument("--cache-dir", default=None,
+                        help="Reuse parses of unchanged files from this parse cache")
+    parser.add_argument("--docx-reader", choices=sorted(DOCX_READERS), default="python-docx",
+                        help="DOCX backend (stream also extracts table text)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-parse new/changed inputs (defaults source to inputs/)")
+    parser.add_argument("--metrics-jsonl", default=None,
+                        help="Append one JSON line of parse metrics per file here")
+    parser.add_argument("--metrics-prom", default=None,
+                        help="Write per-reader totals in Prometheus text format here")
+    parser.add_argument("--corpus", default=None,
+                        help="Append documents to this corpus store instead of writing .txt files")
+    return parser
+
+
 if __name__ == "__main__":
-    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    parser = build_arg_parser()
+    args = parser.parse_args()
+    if args.incremental and args.corpus:
+        parser.error("--corpus is append-only and cannot be combined with --incremental")
+
+    if args.incremental and not args.source:
+        args.source = INPUT_DIR
+
+    if args.source:
+        parse_batch(args.source, args.output_dir, workers=args.workers,
+                    cache_dir=args.cache_dir, docx_reader=args.docx_reader,
+                    incremental=args.incremental, metrics_jsonl=args.metrics_jsonl,
+                    metrics_prom=args.metrics_prom, corpus_dir=args.corpus)
+    else:
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    parse_and_save("resume-1.pdf", "resume1_parsed.txt")
-    parse_and_save("resume-2.docx", "resume2_parsed.txt")
-    parse_and_save("JD.txt", "JD_parsed.txt")
+        parse_and_save("resume-1.pdf", "resume1_parsed.txt")
+        parse_and_save("resume-2.docx", "resume2_parsed.txt")
+        parse_and_save("JD.txt", "JD_parsed.txt")
 
-    print("\n🎉 Task 1 complete! Check outputs/ folder.")
+        print("\n🎉 Task 1 complete! Check outputs/ folder.")
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from text_cleaner import CLEANER_VERSION
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".parse_cache")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_digest(file_path: str) -> str:
+    """
+    Returns:
+        str: SHA-256 hex digest of the file bytes, read in chunks
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ParseCache:
+    """
+    On-disk cache of (raw_text, cleaned_text) keyed by the file's content
+    hash plus CLEANER_VERSION. Entries are JSON files; once the total size
+    exceeds `max_bytes` the least recently used entries are evicted.
+
+    The size is tracked per instance, so when several processes write to
+    the same directory (parse_batch workers) each is opened with
+    `auto_evict=False` and the parent calls trim() once they are done.
+    """
+
+    def __init__(self, cache_dir: str = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES,
+                 auto_evict: bool = True):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.auto_evict = auto_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(cache_dir, exist_ok=True)
+        self._entries = OrderedDict()  # key -> size, least recently used first
+        self._size = 0
+        self._load_index()
+
+    def _load_index(self):
+        self._entries.clear()
+        self._size = 0
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, name[:-len(".json")], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._entries[key] = size
+            self._size += size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".json")
+
+    def key_for(self, file_path: str, variant: str = "") -> str:
+        """
+        Returns:
+            str: Cache key for the file's current contents. `variant` folds in
+            anything else that changes the output (e.g. page options).
+        """
+        digest = hashlib.sha256()
+        digest.update(file_digest(file_path).encode("ascii"))
+        digest.update(f"\0cleaner={CLEANER_VERSION}\0{variant}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[str, str]]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self._forget(key)
+            self.misses += 1
+            return None
+
+        os.utime(path)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        self.hits += 1
+        return entry["raw"], entry["cleaned"]
+
+    def put(self, key: str, raw_text: str, cleaned_text: str):
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"raw": raw_text, "cleaned": cleaned_text}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        self._forget(key)
+        size = os.path.getsize(path)
+        self._entries[key] = size
+        self._size += size
+        if self.auto_evict:
+            self._evict()
+
+    def trim(self) -> int:
+        """
+        Re-reads every entry's size and last use from disk, so entries
+        written by other processes count, then evicts down to `max_bytes`.
+
+        Returns:
+            int: Number of entries evicted
+        """
+        evictions = self.evictions
+        self._load_index()
+        self._evict()
+        return self.evictions - evictions
+
+    def _forget(self, key: str):
+        size = self._entries.pop(key, None)
+        if size is not None:
+            self._size -= size
+
+    def _evict(self):
+        while self._size > self.max_bytes and len(self._entries) > 1:
+            key, size = self._entries.popitem(last=False)
+            self._size -= size
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+            self.evictions += 1
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._size,
+        }
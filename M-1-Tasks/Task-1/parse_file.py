@@ -1,30 +1,269 @@
+import codecs
+import importlib
 import os
-from typing import Tuple
+import time
+import zipfile
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple, Union
 
-from file_reader import read_txt
-from file_reader_pdf import read_pdf
-from file_reader_doc import read_docx
-from text_cleaner import basic_clean
+import ingest_metrics
+from parse_cache import ParseCache
+from text_cleaner import PAGE_SEPARATOR, PageCleaner, basic_clean
 
-SUPPORTED_EXTENSIONS = {".txt", ".pdf", ".docx"}
+SUPPORTED_EXTENSIONS = set()
+_SNIFF_BYTES = 512
 
 
-def extract_text_auto(file_path: str) -> Tuple[str, str]:
+class ReaderSpec:
     """
-    Returns tuple of (raw_text, cleaned_text)
+    A registered input format. `target` is either a callable or a
+    "module:function" string that is imported the first time the format is
+    used, so e.g. PyPDF2 is never loaded for a run that only sees .txt files.
+
+    Plain readers take a path and return the raw text. Paged readers
+    (`paged=True`) yield (page_number, page_text) and accept page options;
+    their pages are cleaned one at a time as they are produced.
+    """
+
+    def __init__(self, name: str, target: Union[str, Callable], extensions: Iterable[str] = (),
+                 magic: Iterable[bytes] = (), check: Optional[Callable[[str], bool]] = None,
+                 paged: bool = False):
+        self.name = name
+        self.target = target
+        self.extensions = tuple(ext.lower() for ext in extensions)
+        self.magic = tuple(magic)
+        self.check = check
+        self.paged = paged
+        self._reader = target if callable(target) else None
+
+    def load(self) -> Callable:
+        if self._reader is None:
+            module_name, func_name = self.target.split(":")
+            self._reader = getattr(importlib.import_module(module_name), func_name)
+        return self._reader
+
+    def matches_magic(self, head: bytes, file_path: str) -> bool:
+        if not any(head.startswith(prefix) for prefix in self.magic):
+            return False
+        return self.check is None or self.check(file_path)
+
+
+_READERS: Dict[str, ReaderSpec] = {}
+
+
+def register_reader(name: str, target: Union[str, Callable], extensions: Iterable[str] = (),
+                    magic: Iterable[bytes] = (), check: Optional[Callable[[str], bool]] = None,
+                    paged: bool = False) -> ReaderSpec:
+    """
+    Registers (or replaces) the reader for a format. Formats are detected by
+    `magic` byte prefixes first (narrowed by `check` when several formats
+    share a container, e.g. zip), then by file extension.
+    """
+    spec = ReaderSpec(name, target, extensions, magic, check, paged)
+    _READERS[name] = spec
+    SUPPORTED_EXTENSIONS.update(spec.extensions)
+    return spec
+
+
+def _is_docx(file_path: str) -> bool:
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return "word/document.xml" in archive.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return False
+
+
+register_reader("pdf", "file_reader_pdf:iter_pdf_pages", [".pdf"], [b"%PDF-"], paged=True)
+register_reader("docx", "file_reader_doc:read_docx", [".docx"], [b"PK\x03\x04"], _is_docx)
+register_reader("txt", "file_reader:read_txt", [".txt"])
+# Not auto-detected; selected with docx_reader="stream"
+register_reader("docx-stream", "file_reader_docx_stream:read_docx_stream")
+
+# "stream" reads word/document.xml incrementally and also picks up table text
+DOCX_READERS = {
+    "python-docx": "docx",
+    "stream": "docx-stream",
+}
+
+
+def _looks_like_text(head: bytes) -> bool:
+    if b"\x00" in head:
+        return False
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_format(file_path: str) -> str:
     """
+    Returns:
+        str: Registered format name, from the leading bytes when they are
+        recognised, otherwise from the extension. A file whose extension
+        claims a binary format but whose bytes are plain text is read as txt.
+    """
+    try:
+        with open(file_path, "rb") as f:
+            head = f.read(_SNIFF_BYTES)
+    except OSError:
+        head = b""
+
+    if head:
+        for spec in _READERS.values():
+            if spec.magic and spec.matches_magic(head, file_path):
+                return spec.name
+
     _, ext = os.path.splitext(file_path.lower())
-    raw_text = ""
-    if ext == ".txt":
-        raw_text = read_txt(file_path)
-    elif ext == ".pdf":
-        raw_text = read_pdf(file_path)
-    elif ext == ".docx":
-        raw_text = read_docx(file_path)
-    else:
-        raise ValueError(f"Unsupported file type: {ext}")
+    for spec in _READERS.values():
+        if ext in spec.extensions:
+            if spec.magic and head and _looks_like_text(head):
+                return "txt"
+            return spec.name
+    raise ValueError(f"Unsupported file type: {ext}")
 
+
+def _iter_clean_pages(spec: ReaderSpec, file_path: str, **page_options) -> Iterator[Tuple[int, str, str]]:
+    cleaner = PageCleaner()
+    previous = None
+    for page_number, page_text in spec.load()(file_path, **page_options):
+        if previous is not None:
+            yield previous
+        previous = (page_number, page_text, cleaner.feed(page_text))
+    if previous is not None:
+        page_number, page_text, cleaned = previous
+        yield page_number, page_text, " ".join(part for part in (cleaned, cleaner.finish()) if part)
+
+
+def iter_clean_pages(file_path: str, **page_options) -> Iterator[Tuple[int, str, str]]:
+    """
+    Yields (page_number, raw_text, cleaned_text) for each PDF page as soon as
+    it is extracted, so callers can start work before the file is parsed.
+    `page_options` are forwarded to `iter_pdf_pages` (page range, max_pages,
+    max_chars). Each page is yielded once the next one has been read: the
+    last word of a page is cleaned with the next page, so a word hyphenated
+    across the break is joined, and the non-empty cleaned texts joined with
+    " " equal the document's cleaned text.
+    """
+    return _iter_clean_pages(_READERS["pdf"], file_path, **page_options)
+
+
+class _Extraction:
+    __slots__ = ("raw_text", "cleaned", "pages", "parse_seconds", "clean_seconds")
+
+    def __init__(self, raw_text="", cleaned="", pages=None, parse_seconds=0.0, clean_seconds=0.0):
+        self.raw_text = raw_text
+        self.cleaned = cleaned
+        self.pages = pages
+        self.parse_seconds = parse_seconds
+        self.clean_seconds = clean_seconds
+
+
+def _extract_paged(spec: ReaderSpec, file_path: str, **page_options) -> _Extraction:
+    raw_pages = []
+    cleaned_pages = []
+    cleaner = PageCleaner()
+    clean_seconds = 0.0
+    label = spec.name.upper()
+    start = time.perf_counter()
+    try:
+        for _, raw_page in spec.load()(file_path, **page_options):
+            raw_pages.append(raw_page)
+            clean_start = time.perf_counter()
+            cleaned_page = cleaner.feed(raw_page)
+            clean_seconds += time.perf_counter() - clean_start
+            if cleaned_page:
+                cleaned_pages.append(cleaned_page)
+    except FileNotFoundError:
+        print(f"❌ {label} file not found")
+        return _Extraction(parse_seconds=time.perf_counter() - start)
+    except Exception as e:
+        print(f"❌ Error reading {label} file: {e}")
+        return _Extraction(parse_seconds=time.perf_counter() - start)
+    clean_start = time.perf_counter()
+    cleaned_page = cleaner.finish()
+    clean_seconds += time.perf_counter() - clean_start
+    if cleaned_page:
+        cleaned_pages.append(cleaned_page)
+    parse_seconds = time.perf_counter() - start - clean_seconds
+    # Same text as basic_clean(raw_text): the cleaner carries words across pages
+    return _Extraction(PAGE_SEPARATOR.join(raw_pages), " ".join(cleaned_pages), len(raw_pages),
+                       parse_seconds, clean_seconds)
+
+
+def _extract_uncached(spec: ReaderSpec, file_path: str, **page_options) -> _Extraction:
+    if spec.paged:
+        return _extract_paged(spec, file_path, **page_options)
+
+    start = time.perf_counter()
+    raw_text = spec.load()(file_path)
+    parsed = time.perf_counter()
     cleaned = basic_clean(raw_text)
-    return raw_text, cleaned
+    return _Extraction(raw_text, cleaned, None, parsed - start, time.perf_counter() - parsed)
+
+
+def _emit_record(file_path: str, fmt: str, result: _Extraction, cache_hit: bool = False):
+    try:
+        bytes_in = os.path.getsize(file_path)
+    except OSError:
+        bytes_in = 0
+    ingest_metrics.emit(ingest_metrics.ParseRecord(
+        file_path=file_path,
+        reader=fmt,
+        bytes_in=bytes_in,
+        pages=result.pages,
+        chars_out=len(result.cleaned),
+        parse_seconds=result.parse_seconds,
+        clean_seconds=result.clean_seconds,
+        cache_hit=cache_hit,
+    ))
+
+
+def _extract_with_cache(spec: ReaderSpec, file_path: str, cache: Optional[ParseCache],
+                        **page_options) -> Tuple[_Extraction, bool]:
+    if cache is None:
+        return _extract_uncached(spec, file_path, **page_options), False
+
+    start = time.perf_counter()
+    try:
+        key = cache.key_for(file_path, variant=f"{spec.name}:{sorted(page_options.items())}")
+    except OSError:
+        return _extract_uncached(spec, file_path, **page_options), False
+    cached = cache.get(key)
+    if cached is not None:
+        return _Extraction(cached[0], cached[1], parse_seconds=time.perf_counter() - start), True
 
+    result = _extract_uncached(spec, file_path, **page_options)
+    if result.raw_text:
+        cache.put(key, result.raw_text, result.cleaned)
+    return result, False
+
+
+def extract_text_auto(
+    file_path: str,
+    cache: Optional[ParseCache] = None,
+    docx_reader: str = "python-docx",
+    **page_options,
+) -> Tuple[str, str]:
+    """
+    Returns tuple of (raw_text, cleaned_text)
+
+    The format is sniffed from the file's leading bytes (falling back to the
+    extension) and its reader module is imported on first use. Pages of
+    paged formats (PDF) are cleaned one at a time as they stream out of the
+    reader; `page_options` (start_page, end_page, max_pages, max_chars) only
+    apply to them. With a `cache`, unchanged files are served from disk
+    without touching PyPDF2/python-docx. `docx_reader` picks an entry of
+    DOCX_READERS. When hooks are registered in `ingest_metrics`, a
+    ParseRecord with sizes and parse/clean durations is emitted per call.
+    """
+    if docx_reader not in DOCX_READERS:
+        raise ValueError(f"Unknown DOCX reader: {docx_reader}")
+    fmt = detect_format(file_path)
+    if fmt == "docx":
+        fmt = DOCX_READERS[docx_reader]
+    spec = _READERS[fmt]
 
+    result, cache_hit = _extract_with_cache(spec, file_path, cache, **page_options)
+    if ingest_metrics.has_hooks():
+        _emit_record(file_path, fmt, result, cache_hit)
+    return result.raw_text, result.cleaned
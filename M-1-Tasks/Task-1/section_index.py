@@ -0,0 +1,155 @@
+import json
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from text_cleaner import basic_clean
+
+# Bump whenever heading detection changes, so incremental runs rebuild the
+# *_sections.json files.
+SECTION_INDEX_VERSION = "2"
+
+# Canonical section -> headings that introduce it (matched case-insensitively)
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "summary": ["professional summary", "summary", "career objective", "objective", "profile",
+                "about the role"],
+    "skills": ["technical skills", "key skills", "core skills", "skills", "skill set",
+               "core competencies", "competencies"],
+    "experience": ["work experience", "professional experience", "experience",
+                   "employment history", "internships", "internship"],
+    "education": ["education", "academic background", "qualifications"],
+    "projects": ["academic projects", "personal projects", "projects"],
+    "certifications": ["certifications", "certificates"],
+    "responsibilities": ["key responsibilities", "responsibilities"],
+    "requirements": ["preferred qualifications", "requirements"],
+    "compensation": ["compensation", "benefits"],
+}
+
+_HEADING_TO_SECTION = {
+    heading: section for section, headings in SECTION_HEADINGS.items() for heading in headings
+}
+# Longest first so "Technical Skills" wins over "Skills"
+_ALTERNATION = "|".join(
+    re.escape(heading).replace(r"\ ", r"\s+")
+    for heading in sorted(_HEADING_TO_SECTION, key=len, reverse=True)
+)
+# A heading starts a line: "Heading:" followed by its body, or the heading
+# alone on its line. "... communication skills: ..." or "Experience: 2+
+# years" inside a sentence is not a heading.
+_HEADING_RE = re.compile(
+    rf"^[ \t]*(?:(?P<inline>{_ALTERNATION})[ \t]*:|(?P<line>{_ALTERNATION})[ \t]*$)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# A heading found in the raw text, at its offset in the cleaned text
+_CLEANED_HEADING_RE = re.compile(rf"(?P<heading>{_ALTERNATION})(?:\s*:)?", re.IGNORECASE)
+
+
+def _canonical(heading: str) -> str:
+    return " ".join(heading.lower().split())
+
+
+def _iter_heading_matches(text: str) -> Iterator[Tuple[str, re.Match]]:
+    for match in _HEADING_RE.finditer(text):
+        if match.group("inline") is not None:
+            yield "inline", match
+        elif match.group("line")[0].isupper():
+            # A lower-case word alone on a line is a wrapped sentence
+            yield "line", match
+
+
+def _find_headings(text: str, raw: Optional[str]) -> Iterator[Tuple[str, int, int]]:
+    """
+    Yields (heading, start, body_start) offsets into `text`. Cleaned text
+    has no line breaks left, so with `raw` the headings are found in the raw
+    text and located in `text` by cleaning the raw text between them: each
+    piece starts at a line, so the cleaned pieces joined by a space are the
+    cleaned text.
+    """
+    if raw is None:
+        for group, match in _iter_heading_matches(text):
+            yield match.group(group), match.start(group), match.end()
+        return
+
+    piece_start = 0
+    offset = 0
+    for group, match in _iter_heading_matches(raw):
+        piece = basic_clean(raw[piece_start:match.start(group)])
+        start = offset + len(piece) + (1 if piece else 0)
+        found = _CLEANED_HEADING_RE.match(text, start)
+        if found is None or _canonical(found.group("heading")) != _canonical(match.group(group)):
+            # Cleaning joined the heading to the line before it ("-\n")
+            continue
+        yield found.group("heading"), start, found.end()
+        piece_start, offset = match.start(group), start
+
+
+def build_section_index(text: str, raw: Optional[str] = None) -> List[dict]:
+    """
+    Args:
+        text: Text the offsets refer to, normally the cleaned text
+        raw: Raw text `text` was cleaned from; headings are only recognised
+            at the start of a line, so pass it whenever `text` is cleaned
+
+    Returns:
+        list: One dict per heading found, in order, with the canonical
+        `section`, the `heading` as written, and character offsets `start`
+        (heading), `body_start` (after the heading) and `end` (next heading
+        or end of text).
+    """
+    text = text or ""
+    index = []
+    for heading, start, body_start in _find_headings(text, raw):
+        if index:
+            index[-1]["end"] = start
+        index.append({
+            "section": _HEADING_TO_SECTION[_canonical(heading)],
+            "heading": heading,
+            "start": start,
+            "body_start": body_start,
+            "end": len(text),
+        })
+    return index
+
+
+def iter_section_spans(index: List[dict], sections: Iterable[str]) -> Iterator[Tuple[int, int]]:
+    """
+    Yields (body_start, end) offsets of the wanted sections, in text order.
+    """
+    wanted = set(sections)
+    for entry in index:
+        if entry["section"] in wanted:
+            yield entry["body_start"], entry["end"]
+
+
+def section_text(text: str, index: List[dict], sections: Iterable[str]) -> str:
+    """
+    Returns:
+        str: Bodies of the wanted sections joined by a space, or the whole
+        text when none of them was found
+    """
+    spans = list(iter_section_spans(index, sections))
+    if not spans:
+        return text
+    return " ".join(text[start:end].strip() for start, end in spans)
+
+
+def save_section_index(index: List[dict], path: str):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(index, f, indent=2)
+
+
+def load_section_index(path: str) -> List[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+if __name__ == "__main__":
+    import os
+
+    from parse_file import extract_text_auto
+
+    raw, resume = extract_text_auto(os.path.join(os.path.dirname(__file__), "inputs", "resume-1.pdf"))
+    for entry in build_section_index(resume, raw):
+        print(f"{entry['section']:<16} {entry['start']:>5}-{entry['end']:<5} {entry['heading']}")
@@ -0,0 +1,69 @@
+import hashlib
+import os
+
+import pytest
+
+from corpus_store import BLOB_NAME, INDEX_MAGIC, INDEX_NAME, CorpusReader, CorpusWriter
+
+
+def _sha(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _append(writer: CorpusWriter, name: str) -> int:
+    return writer.append(f"{name}.pdf", _sha(name), f"raw {name}", f"cleaned {name}")
+
+
+def test_torn_index_record_is_dropped_on_reopen(tmp_path):
+    with CorpusWriter(str(tmp_path)) as writer:
+        _append(writer, "first")
+        _append(writer, "second")
+
+    # Simulate a crash mid-append: blob bytes plus half of the second record
+    index_path = tmp_path / INDEX_NAME
+    blob_path = tmp_path / BLOB_NAME
+    record_size = (os.path.getsize(index_path) - len(INDEX_MAGIC)) // 2
+    with open(index_path, "r+b") as f:
+        f.truncate(len(INDEX_MAGIC) + record_size + record_size // 2)
+    with open(blob_path, "ab") as f:
+        f.write(b"unreferenced bytes of a lost document")
+
+    with CorpusWriter(str(tmp_path)) as writer:
+        assert len(writer) == 1
+        assert _append(writer, "third") == 1
+
+    assert os.path.getsize(index_path) == len(INDEX_MAGIC) + 2 * record_size
+    with CorpusReader(str(tmp_path)) as reader:
+        assert len(reader) == 2
+        assert reader.get(0) == {"doc_id": 0, "sha256": _sha("first"), "source": "first.pdf",
+                                 "raw": "raw first", "cleaned": "cleaned first", "sections": []}
+        assert reader.get(1) == {"doc_id": 1, "sha256": _sha("third"), "source": "third.pdf",
+                                 "raw": "raw third", "cleaned": "cleaned third", "sections": []}
+
+
+def test_torn_magic_restarts_the_corpus(tmp_path):
+    (tmp_path / INDEX_NAME).write_bytes(INDEX_MAGIC[:3])
+    (tmp_path / BLOB_NAME).write_bytes(b"orphaned")
+    with CorpusWriter(str(tmp_path)) as writer:
+        assert _append(writer, "only") == 0
+    with CorpusReader(str(tmp_path)) as reader:
+        assert reader.get(0)["cleaned"] == "cleaned only"
+
+
+def test_section_index_round_trips(tmp_path):
+    sections = [{"section": "skills", "heading": "Skills", "start": 0, "body_start": 7, "end": 13}]
+    with CorpusWriter(str(tmp_path)) as writer:
+        writer.append("cv.pdf", _sha("cv"), "Skills\nPython", "Skills Python", sections)
+    with CorpusReader(str(tmp_path)) as reader:
+        assert reader.sections(0) == sections
+        assert reader.get(0)["sections"] == sections
+
+
+def test_older_corpus_is_rejected(tmp_path):
+    (tmp_path / INDEX_NAME).write_bytes(b"SGCORP01" + b"\0" * 80)
+    (tmp_path / BLOB_NAME).write_bytes(b"")
+    with pytest.raises(ValueError):
+        CorpusWriter(str(tmp_path))
+    with pytest.raises(ValueError):
+        CorpusReader(str(tmp_path))
+    assert (tmp_path / INDEX_NAME).read_bytes()[:8] == b"SGCORP01"
@@ -1,32 +1,52 @@
 import re
 from typing import List, Callable
 
+# Bump whenever cleaned output changes (basic_clean, page joining) so cached
+# parses are invalidated.
+CLEANER_VERSION = "2"
+# Paged readers (PDF) join pages with this in the raw text
+PAGE_SEPARATOR = "\n"
+
+
+_CRLF_RE = re.compile(r"\r\n|\r")
+_NBSP_RE = re.compile(r"\u00a0")
+_TABS_RE = re.compile(r"\t+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_EMAIL_RE = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_HYPHEN_BREAK_RE = re.compile(r"-\n\s*")
+_NON_SPACE_RUN_RE = re.compile(r"\S*")
+
 
 def normalize_whitespace(text: str) -> str:
     if not text:
         return ""
-    text = re.sub(r"\r\n|\r", "\n", text)
-    text = re.sub(r"\u00a0", " ", text)
-    text = re.sub(r"\t+", " ", text)
-    text = re.sub(r"\s+", " ", text)
+    text = _CRLF_RE.sub("\n", text)
+    text = _NBSP_RE.sub(" ", text)
+    text = _TABS_RE.sub(" ", text)
+    text = _WHITESPACE_RE.sub(" ", text)
     return text.strip()
 
 
 def remove_emails(text: str) -> str:
-    return re.sub(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}", " ", text)
+    return _EMAIL_RE.sub(" ", text)
 
 
 def remove_urls(text: str) -> str:
-    return re.sub(r"https?://\S+|www\.\S+", " ", text)
+    return _URL_RE.sub(" ", text)
 
 
 def dehyphenate_line_breaks(text: str) -> str:
     if not text:
         return ""
-    return re.sub(r"-\n\s*", "", text)
+    return _HYPHEN_BREAK_RE.sub("", text)
 
 
-def basic_clean(text: str) -> str:
+def chain_clean(text: str) -> str:
+    """
+    Reference implementation: applies each transform as its own pass.
+    `basic_clean` must produce exactly the same output.
+    """
     transformations: List[Callable[[str], str]] = [
         dehyphenate_line_breaks,
         remove_urls,
@@ -39,6 +59,92 @@ def basic_clean(text: str) -> str:
     return cleaned_text
 
 
+def _remove_emails_near_at(text: str) -> str:
+    # URL and email matches never contain whitespace, so the email pattern
+    # only needs to run over the whitespace-delimited runs holding an "@".
+    at = text.find("@")
+    if at == -1:
+        return text
+    pieces = []
+    last = 0
+    while at != -1:
+        start = at
+        while start > last and not text[start - 1].isspace():
+            start -= 1
+        end = _NON_SPACE_RUN_RE.match(text, at).end()
+        pieces.append(text[last:start])
+        pieces.append(_EMAIL_RE.sub(" ", text[start:end]))
+        last = end
+        at = text.find("@", end)
+    pieces.append(text[last:])
+    return "".join(pieces)
+
+
+def basic_clean(text: str) -> str:
+    """
+    Same output as `chain_clean`, in fewer passes: transforms whose trigger
+    substring is absent are skipped, emails are only searched for around
+    "@", and the four whitespace substitutions plus strip() collapse into a
+    single split/join (str.split() and regex \\s agree on what whitespace is).
+    """
+    if not text:
+        return ""
+    if "-\n" in text:
+        text = _HYPHEN_BREAK_RE.sub("", text)
+    if "http" in text or "www." in text:
+        text = _URL_RE.sub(" ", text)
+    text = _remove_emails_near_at(text)
+    return " ".join(text.split())
+
+
+
+class PageCleaner:
+    """
+    Cleans a paged document one page at a time with the same result as
+    basic_clean(PAGE_SEPARATOR.join(pages)). The last word of each page is
+    held back until the next page arrives, together with any words a
+    trailing "-\n" would glue onto it, so neither a word nor a hyphenated
+    word split across a page boundary is cut.
+    """
+
+    def __init__(self):
+        self._carry = ""
+        self._pages = 0
+
+    def feed(self, page: str) -> str:
+        """
+        Returns:
+            str: Cleaned text that is now final (may be empty)
+        """
+        text = (self._carry + PAGE_SEPARATOR if self._pages else "") + page
+        self._pages += 1
+        cut = len(text)
+        while cut:
+            # Step back over trailing whitespace and the last word
+            end = cut
+            while end and text[end - 1].isspace():
+                end -= 1
+            cut = end
+            while cut and not text[cut - 1].isspace():
+                cut -= 1
+            # Keep going while the kept text ends in "-\n" + whitespace
+            before = cut
+            while before and text[before - 1].isspace():
+                before -= 1
+            if not (before and text[before - 1] == "-" and text[before] == "\n"):
+                break
+        self._carry = text[cut:]
+        return basic_clean(text[:cut])
+
+    def finish(self) -> str:
+        """
+        Returns:
+            str: The cleaned remainder after the last page
+        """
+        carry, self._carry = self._carry, ""
+        return basic_clean(carry)
+
+
 if __name__ == "__main__":
     sample = (
         "Email: john.doe@example.com\nLinkedIn: https://linkedin.com/in/john\n"
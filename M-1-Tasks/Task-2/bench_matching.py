@@ -0,0 +1,73 @@
+# Task-2/bench_matching.py
+"""
+Benchmark: skills-dictionary matching throughput (docs/sec).
+
+Compares the old path (full en_core_web_sm pipeline, one nlp() call per
+text) with the tokenizer-only path and nlp.pipe batching, and checks that
+every spaCy mode finds exactly the same skills. The Aho–Corasick engine
+(skill_automaton.py) is timed too; it reports canonical dictionary entries
+rather than surface text, so it is not compared.
+
+    python bench_matching.py [--docs 2000] [--batch-size 256] [--n-process 1 2 4]
+"""
+import argparse
+import glob
+import os
+import time
+
+import spacy
+
+from skill_automaton import SkillAutomaton
+from skill_matcher import build_matcher, match_batch, match_text, read_skills
+
+BASE_DIR = os.path.dirname(__file__)
+SKILLS_FILE = os.path.join(BASE_DIR, "skills_dict.txt")
+PARSED_GLOB = os.path.join(BASE_DIR, "../Task-1/outputs/*_parsed.txt")
+
+
+def load_corpus(n_docs: int):
+    texts = []
+    for path in sorted(glob.glob(PARSED_GLOB)):
+        with open(path, "r", encoding="utf-8") as f:
+            texts.append(f.read())
+    if not texts:
+        raise SystemExit("Run Task-1/parse_and_clean.py first to generate outputs.")
+    return [texts[i % len(texts)] for i in range(n_docs)]
+
+
+def run(label, func, n_docs, baseline=None):
+    start = time.perf_counter()
+    results = func()
+    elapsed = time.perf_counter() - start
+    if baseline is not None:
+        assert results == baseline, f"{label}: matches differ from the full pipeline"
+    print(f"{label:<40} {n_docs / elapsed:9.1f} docs/sec")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--n-process", type=int, nargs="+", default=[1, 2])
+    args = parser.parse_args()
+
+    nlp = spacy.load("en_core_web_sm")
+    skills, _ = read_skills(SKILLS_FILE)
+    matcher = build_matcher(nlp, skills)
+    texts = load_corpus(args.docs)
+    print(f"{len(texts)} docs, {len(skills)} dictionary entries\n")
+
+    baseline = run("full pipeline, nlp() per doc",
+                   lambda: [match_text(nlp, matcher, t, tokenizer_only=False) for t in texts], len(texts))
+    run("full pipeline, nlp.pipe",
+        lambda: match_batch(nlp, matcher, texts, args.batch_size, tokenizer_only=False),
+        len(texts), baseline)
+    run("tokenizer only, make_doc per doc",
+        lambda: [match_text(nlp, matcher, t) for t in texts], len(texts), baseline)
+    for n_process in args.n_process:
+        run(f"tokenizer only, pipe (n_process={n_process})",
+            lambda: match_batch(nlp, matcher, texts, args.batch_size, n_process), len(texts), baseline)
+
+    automaton = SkillAutomaton.from_skills(skills)
+    run("aho-corasick, one pass per doc", lambda: [automaton.match_text(t) for t in texts], len(texts))
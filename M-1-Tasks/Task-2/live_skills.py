@@ -0,0 +1,172 @@
+# Task-2/live_skills.py
+"""
+Hot-reloadable skills dictionary.
+
+`LiveSkillMatcher` keeps one PhraseMatcher alive for the lifetime of the
+process and follows edits to skills_dict.txt: when the file changes, only
+the added and removed entries are applied to the matcher (each skill is its
+own match key, so it can be removed on its own). Requests match inside
+`snapshot()`; an update waits for those to finish and new requests wait for
+the update, so a request always sees one complete version of the dictionary.
+"""
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+from spacy.matcher import PhraseMatcher
+
+from skill_matcher import read_skills
+
+
+class SkillsSnapshot(NamedTuple):
+    version: int
+    skills: Tuple[str, ...]
+    skills_hash: str
+    matcher: PhraseMatcher
+
+
+class SkillsChange(NamedTuple):
+    version: int
+    added: List[str]
+    removed: List[str]
+
+
+class _ReadWriteLock:
+    """
+    Many readers or one writer. A waiting writer blocks new readers so a
+    steady stream of requests cannot starve a reload.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._readers = 0
+        self._writing = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def reading(self):
+        with self._cond:
+            while self._writing or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def writing(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writing or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writing = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+
+class LiveSkillMatcher:
+    def __init__(self, nlp, path: str):
+        """
+        Raises:
+            FileNotFoundError: If the dictionary does not exist yet
+        """
+        self.nlp = nlp
+        self.path = path
+        self.version = 0
+        self._lock = _ReadWriteLock()
+        self._reload_lock = threading.Lock()
+        self._stat = self._stat_file()
+        skills, self._hash = read_skills(path)
+        self._skills = tuple(dict.fromkeys(skills))
+        self._matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+        self._add(self._skills)
+        self._watcher: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def _stat_file(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_size, stat.st_mtime_ns
+
+    def _add(self, skills):
+        for skill, pattern in zip(skills, self.nlp.tokenizer.pipe(skills)):
+            self._matcher.add(skill, [pattern])
+
+    @contextmanager
+    def snapshot(self) -> Iterator[SkillsSnapshot]:
+        """
+        Holds the current dictionary version steady for the duration of the
+        block; match with `snapshot.matcher` inside it.
+        """
+        with self._lock.reading():
+            yield SkillsSnapshot(self.version, self._skills, self._hash, self._matcher)
+
+    def refresh(self) -> Optional[SkillsChange]:
+        """
+        Applies the file's changes to the live matcher if it was modified.
+        Cheap when nothing changed (one stat call). If the file is missing
+        or unreadable, for instance mid-save, the current version stays.
+
+        Returns:
+            SkillsChange: The applied diff, or None if nothing changed
+        """
+        with self._reload_lock:
+            try:
+                stat = self._stat_file()
+                if stat == self._stat:
+                    return None
+                skills, skills_hash = read_skills(self.path)
+            except (OSError, UnicodeDecodeError):
+                return None
+            self._stat = stat
+            if skills_hash == self._hash:
+                return None
+
+            skills = tuple(dict.fromkeys(skills))
+            current = set(self._skills)
+            added = [skill for skill in skills if skill not in current]
+            wanted = set(skills)
+            removed = [skill for skill in self._skills if skill not in wanted]
+            # Tokenize outside the write lock; only the matcher edits block readers
+            patterns = list(self.nlp.tokenizer.pipe(added))
+
+            with self._lock.writing():
+                for skill in removed:
+                    self._matcher.remove(skill)
+                for skill, pattern in zip(added, patterns):
+                    self._matcher.add(skill, [pattern])
+                self._skills = skills
+                self._hash = skills_hash
+                self.version += 1
+            return SkillsChange(self.version, added, removed)
+
+    def watch(self, interval: float = 2.0):
+        """
+        Polls the file from a daemon thread so changes are applied even
+        between requests. Calling `refresh()` per request works too.
+        """
+        if self._watcher is not None:
+            return
+        self._stop.clear()
+
+        def poll():
+            while not self._stop.wait(interval):
+                self.refresh()
+
+        self._watcher = threading.Thread(target=poll, name="skills-dict-watcher", daemon=True)
+        self._watcher.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
@@ -0,0 +1,320 @@
+# Task-2/skill_automaton.py
+"""
+Aho–Corasick automaton for dictionary skill matching.
+
+Every mention of every dictionary entry is found in one left-to-right pass
+over the text, so the cost grows with the text, not with the size of the
+dictionary. Matching is case-insensitive, treats any run of whitespace as a
+single space, and only reports mentions that sit on word boundaries ("Go"
+does not match inside "Google"). Offsets always refer to the original text.
+
+The compiled automaton can be saved to a compact binary file and loaded
+again without rebuilding the trie or recomputing failure links:
+
+    python skill_automaton.py skills_dict.txt -o skills_dict.ac
+"""
+import hashlib
+import json
+import os
+import struct
+import zlib
+from array import array
+from collections import deque
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+FILE_MAGIC = b"SGAC0001"
+_HEADER = struct.Struct("<8sI")       # magic, length of the JSON metadata
+_CP_BITS = 21                         # enough for any Unicode code point
+_SPACE = ord(" ")
+
+
+class SkillMatch(NamedTuple):
+    start: int
+    end: int
+    canonical: str
+    text: str
+
+
+def normalize(text: str) -> str:
+    """
+    Lowercases and collapses whitespace the same way the scanner does.
+    """
+    return "".join(_fold(ch) for ch in " ".join(text.split()))
+
+
+def _fold(ch: str) -> str:
+    # Characters whose lowercase form is longer (e.g. "İ") are kept as-is so
+    # one text character always maps to one automaton step.
+    lower = ch.lower()
+    return lower if len(lower) == 1 else ch
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def _version_end(text: str, end: int) -> int:
+    """
+    Returns:
+        int: End of a version number ("3", "3.10") starting at `end` that is
+        itself followed by a word boundary, or 0 if there is none
+    """
+    i = end
+    while i < len(text) and (text[i].isdigit() or
+                             (text[i] == "." and i > end and i + 1 < len(text) and text[i + 1].isdigit())):
+        i += 1
+    if i == end or (i < len(text) and _is_word_char(text[i])):
+        return 0
+    return i
+
+
+def entries_hash(entries: Sequence[Tuple[str, str]]) -> str:
+    """
+    Returns:
+        str: sha256 identifying a list of (surface, canonical) entries; saved
+        in the automaton file so a stale artifact can be detected
+    """
+    return hashlib.sha256(json.dumps(list(entries), ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class SkillAutomaton:
+    """
+    Build with `SkillAutomaton.build([(surface, canonical_id), ...])` or
+    `from_skills(skills)`; each surface form reports its canonical id.
+    When two surface forms normalize to the same string, the first wins.
+    """
+
+    def __init__(self, canonical: List[str], patterns: List[str], pattern_ids: List[int],
+                 goto: dict, fail: array, output: array, link: array, source_hash: str = ""):
+        self.canonical = canonical
+        self.patterns = patterns
+        self.pattern_ids = pattern_ids
+        self.source_hash = source_hash
+        self._goto = goto
+        self._fail = fail
+        self._output = output
+        self._link = link
+        self._lengths = [len(p) for p in patterns]
+        self._check_start = [_is_word_char(p[0]) for p in patterns]
+        self._check_end = [_is_word_char(p[-1]) for p in patterns]
+        self._max_len = max(self._lengths, default=1)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    # -----------------------
+    # Building
+    # -----------------------
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, str]], source_hash: str = "") -> "SkillAutomaton":
+        canonical: List[str] = []
+        canonical_index = {}
+        patterns: List[str] = []
+        pattern_ids: List[int] = []
+        seen = set()
+        goto = {}
+        output = array("i", [-1])
+
+        for surface, canonical_id in entries:
+            pattern = normalize(surface)
+            if not pattern or pattern in seen:
+                continue
+            seen.add(pattern)
+            if canonical_id not in canonical_index:
+                canonical_index[canonical_id] = len(canonical)
+                canonical.append(canonical_id)
+            state = 0
+            for ch in pattern:
+                key = state << _CP_BITS | ord(ch)
+                nxt = goto.get(key)
+                if nxt is None:
+                    nxt = len(output)
+                    goto[key] = nxt
+                    output.append(-1)
+                state = nxt
+            output[state] = len(patterns)
+            patterns.append(pattern)
+            pattern_ids.append(canonical_index[canonical_id])
+
+        # Failure links in BFS order; `link` jumps straight to the nearest
+        # state on the failure chain that ends a pattern.
+        children = [[] for _ in range(len(output))]
+        for key, nxt in goto.items():
+            children[key >> _CP_BITS].append((key & ((1 << _CP_BITS) - 1), nxt))
+        fail = array("i", [0]) * len(output)
+        link = array("i", [0]) * len(output)
+        queue = deque(nxt for _, nxt in children[0])
+        while queue:
+            state = queue.popleft()
+            for cp, nxt in children[state]:
+                fallback = fail[state]
+                while fallback and (fallback << _CP_BITS | cp) not in goto:
+                    fallback = fail[fallback]
+                target = goto.get(fallback << _CP_BITS | cp, 0)
+                fail[nxt] = target if target != nxt else 0
+                link[nxt] = fail[nxt] if output[fail[nxt]] >= 0 else link[fail[nxt]]
+                queue.append(nxt)
+        return cls(canonical, patterns, pattern_ids, goto, fail, output, link, source_hash)
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[str], source_hash: str = "") -> "SkillAutomaton":
+        return cls.build(((skill, skill) for skill in skills), source_hash)
+
+    # -----------------------
+    # Matching
+    # -----------------------
+    def iter_matches(self, text: str, allow_version: bool = False) -> Iterator[SkillMatch]:
+        """
+        Yields every dictionary mention on word boundaries, overlaps
+        included, ordered by end offset. With `allow_version`, a mention may
+        run straight into a version number ("python3", "Java8", "Vue2.7"),
+        which is then part of the match.
+        """
+        goto, fail, output, link = self._goto, self._fail, self._output, self._link
+        lengths, pattern_ids, canonical = self._lengths, self.pattern_ids, self.canonical
+        # Original offset of each of the last `max_len` normalized characters
+        positions = deque(maxlen=self._max_len)
+        state = 0
+        prev_space = True
+        for i, ch in enumerate(text):
+            if ch.isspace():
+                if prev_space:
+                    continue
+                prev_space = True
+                cp = _SPACE
+            else:
+                prev_space = False
+                cp = ord(_fold(ch))
+            positions.append(i)
+
+            while True:
+                nxt = goto.get(state << _CP_BITS | cp)
+                if nxt is not None:
+                    state = nxt
+                    break
+                if not state:
+                    break
+                state = fail[state]
+
+            hit = state if output[state] >= 0 else link[state]
+            while hit:
+                pattern = output[hit]
+                start = positions[-lengths[pattern]]
+                end = i + 1
+                if not (self._check_start[pattern] and start and _is_word_char(text[start - 1])):
+                    if self._check_end[pattern] and end < len(text) and _is_word_char(text[end]):
+                        end = _version_end(text, end) if allow_version else 0
+                    if end:
+                        yield SkillMatch(start, end, canonical[pattern_ids[pattern]], text[start:end])
+                hit = link[hit]
+
+    def find_all(self, text: str, overlapping: bool = False, allow_version: bool = False) -> List[SkillMatch]:
+        """
+        Returns:
+            list: Matches ordered by start offset. Unless `overlapping` is
+            set, overlaps are resolved leftmost-longest ("Machine Learning"
+            rather than "Machine Learning" plus "Learning").
+        """
+        matches = sorted(self.iter_matches(text, allow_version), key=lambda m: (m.start, -m.end))
+        if overlapping:
+            return matches
+        selected = []
+        covered_to = 0
+        for match in matches:
+            if match.start >= covered_to:
+                selected.append(match)
+                covered_to = match.end
+        return selected
+
+    def match_text(self, text: str, allow_version: bool = False) -> List[str]:
+        """
+        Returns:
+            list: Sorted unique canonical ids mentioned in the text
+        """
+        return sorted(set(match.canonical for match in self.iter_matches(text, allow_version)))
+
+    # -----------------------
+    # Serialization
+    # -----------------------
+    def save(self, path: str):
+        meta = json.dumps({
+            "source_hash": self.source_hash,
+            "canonical": self.canonical,
+            "patterns": self.patterns,
+            "pattern_ids": self.pattern_ids,
+        }, ensure_ascii=False).encode("utf-8")
+        keys = array("q", self._goto.keys())
+        values = array("i", self._goto.values())
+        body = b"".join(struct.pack("<Q", len(a)) + a.tobytes()
+                        for a in (keys, values, self._fail, self._output, self._link))
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(FILE_MAGIC, len(meta)))
+            f.write(meta)
+            f.write(zlib.compress(body))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "SkillAutomaton":
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, meta_len = _HEADER.unpack_from(data)
+        if magic != FILE_MAGIC:
+            raise ValueError(f"Not a skill automaton file: {path}")
+        meta = json.loads(data[_HEADER.size:_HEADER.size + meta_len])
+        body = memoryview(zlib.decompress(data[_HEADER.size + meta_len:]))
+
+        arrays = []
+        offset = 0
+        for typecode in ("q", "i", "i", "i", "i"):
+            (count,) = struct.unpack_from("<Q", body, offset)
+            offset += 8
+            values = array(typecode)
+            values.frombytes(body[offset:offset + count * values.itemsize])
+            offset += count * values.itemsize
+            arrays.append(values)
+        keys, values, fail, output, link = arrays
+        return cls(meta["canonical"], meta["patterns"], meta["pattern_ids"],
+                   dict(zip(keys, values)), fail, output, link, meta["source_hash"])
+
+
+def load_or_build(path: Optional[str], entries: Sequence[Tuple[str, str]]) -> SkillAutomaton:
+    """
+    Loads the automaton saved at `path` if it was built from exactly these
+    entries; otherwise builds it and (when `path` is given) saves it.
+    """
+    source_hash = entries_hash(entries)
+    if path and os.path.exists(path):
+        try:
+            automaton = SkillAutomaton.load(path)
+            if automaton.source_hash == source_hash:
+                return automaton
+        except (ValueError, KeyError, struct.error, zlib.error):
+            pass
+    automaton = SkillAutomaton.build(entries, source_hash)
+    if path:
+        try:
+            automaton.save(path)
+        except OSError as e:
+            print(f"❌ Could not save skill automaton {path}: {e}")
+    return automaton
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    parser = argparse.ArgumentParser(description="Compile a skills dictionary into an automaton file")
+    parser.add_argument("skills", nargs="?",
+                        default=os.path.join(os.path.dirname(__file__), "skills_dict.txt"))
+    parser.add_argument("-o", "--output", help="default: <skills file>.ac next to the dictionary")
+    args = parser.parse_args()
+
+    with open(args.skills, "r", encoding="utf-8") as f:
+        skills = [line.strip() for line in f if line.strip()]
+    output = args.output or os.path.splitext(args.skills)[0] + ".ac"
+
+    start = time.perf_counter()
+    automaton = load_or_build(output, [(skill, skill) for skill in skills])
+    print(f"{len(automaton)} patterns, {len(automaton._output)} states -> {output} "
+          f"({os.path.getsize(output)} bytes, {time.perf_counter() - start:.2f}s)")
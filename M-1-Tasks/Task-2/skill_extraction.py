@@ -1,8 +1,12 @@
 import os
+import sys
 import spacy
-from spacy.matcher import PhraseMatcher
 import streamlit as st
 
+from live_skills import LiveSkillMatcher
+from skill_automaton import load_or_build
+from skill_matcher import match_batch
+
 # -----------------------
 # File paths
 # -----------------------
@@ -10,6 +14,15 @@ BASE_DIR = os.path.dirname(__file__)   # Task-2 folder
 RESUME_FILE = os.path.join(BASE_DIR, "../Task-1/outputs/resume1_parsed.txt")
 JD_FILE = os.path.join(BASE_DIR, "../Task-1/outputs/jd_parsed.txt")
 SKILLS_FILE = os.path.join(BASE_DIR, "skills_dict.txt")
+AUTOMATON_FILE = os.path.join(BASE_DIR, "skills_dict.ac")
+RESUME_SECTIONS_FILE = os.path.join(BASE_DIR, "../Task-1/outputs/resume1_sections.json")
+
+# Section index (character offsets written by Task-1)
+sys.path.append(os.path.join(BASE_DIR, "../Task-1"))
+from section_index import load_section_index, section_text
+
+# Resume sections worth scanning for skills (see Task-1/section_index.py)
+SKILL_SECTIONS = {"skills", "experience", "projects"}
 
 # -----------------------
 # Load helper function
@@ -23,18 +36,6 @@ def load_file(path):
         st.info("👉 Run Task-1/parse_and_clean.py first to generate outputs.")
         return ""
 
-# -----------------------
-# Load skills dictionary
-# -----------------------
-def load_skills():
-    try:
-        with open(SKILLS_FILE, "r", encoding="utf-8") as f:
-            skills = [line.strip() for line in f if line.strip()]
-        return skills
-    except FileNotFoundError:
-        st.error(f"❌ Skills dictionary not found: {SKILLS_FILE}")
-        return []
-
 # -----------------------
 # Skill extraction
 # -----------------------
@@ -42,18 +43,25 @@ def load_skills():
 def get_nlp():
     return spacy.load("en_core_web_sm")
 
-def extract_skills(text, skills_list):
-    nlp = get_nlp()
-    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
-
-    patterns = [nlp.make_doc(skill) for skill in skills_list]
-    matcher.add("SKILLS", patterns)
+# One live matcher per process, shared across reruns and sessions. Edits to
+# skills_dict.txt are applied to it in place (see live_skills.py), so the
+# app no longer needs a restart when the dictionary changes.
+@st.cache_resource
+def get_live_skills():
+    return LiveSkillMatcher(get_nlp(), SKILLS_FILE)
 
-    doc = nlp(text)
-    matches = matcher(doc)
+def load_live_skills():
+    try:
+        return get_live_skills()
+    except FileNotFoundError:
+        st.error(f"❌ Skills dictionary not found: {SKILLS_FILE}")
+        return None
 
-    found_skills = sorted(set([doc[start:end].text for match_id, start, end in matches]))
-    return found_skills
+# Aho–Corasick alternative for very large dictionaries: one pass per text
+# regardless of dictionary size, loaded from skills_dict.ac when it matches.
+@st.cache_resource(max_entries=4)
+def get_automaton(skills_hash, _skills_list):
+    return load_or_build(AUTOMATON_FILE, [(skill, skill) for skill in _skills_list])
 
 # -----------------------
 # Streamlit App
@@ -62,17 +70,40 @@ st.title("🔎 Skill Extraction from Resume & JD")
 
 st.write("This app extracts skills from a resume and job description using a custom skills dictionary.")
 
-resume_text = st.text_area("Paste Resume Text", load_file(RESUME_FILE), height=200)
+resume_file_text = load_file(RESUME_FILE)
+resume_text = st.text_area("Paste Resume Text", resume_file_text, height=200)
+resume_sections = load_section_index(RESUME_SECTIONS_FILE)
+# Offsets are only valid for the unedited Task-1 output
+sections_usable = bool(resume_sections) and resume_text == resume_file_text
+only_sections = st.checkbox(
+    "Scan only the resume's Skills / Experience / Projects sections",
+    value=sections_usable,
+    disabled=not sections_usable,
+)
 jd_text = st.text_area("Paste JD Text", load_file(JD_FILE), height=200)
-skills_dict = load_skills()
+live_skills = load_live_skills()
 
-if not skills_dict:
+if live_skills is None:
     st.stop()
 
+change = live_skills.refresh()
+if change:
+    st.info(f"🔄 Skills dictionary reloaded (v{change.version}): "
+            f"{len(change.added)} added, {len(change.removed)} removed.")
+
+engine = st.radio("Matching engine", ["spaCy PhraseMatcher", "Aho–Corasick"], horizontal=True)
+
 if st.button("Extract Skills"):
     with st.spinner("Extracting skills..."):
-        resume_skills = extract_skills(resume_text, skills_dict)
-        jd_skills = extract_skills(jd_text, skills_dict)
+        resume_scan = section_text(resume_text, resume_sections, SKILL_SECTIONS) if only_sections else resume_text
+        # Both texts are matched against the same dictionary version even if
+        # a reload lands meanwhile
+        with live_skills.snapshot() as snapshot:
+            if engine == "Aho–Corasick":
+                automaton = get_automaton(snapshot.skills_hash, snapshot.skills)
+                resume_skills, jd_skills = [automaton.match_text(t) for t in (resume_scan, jd_text)]
+            else:
+                resume_skills, jd_skills = match_batch(get_nlp(), snapshot.matcher, [resume_scan, jd_text])
 
     st.subheader("📄 Resume Skills Found")
     st.write(resume_skills if resume_skills else "No skills found.")
@@ -0,0 +1,61 @@
+import hashlib
+from typing import Iterable, List, Tuple
+
+from spacy.matcher import PhraseMatcher
+
+
+def read_skills(path: str) -> Tuple[List[str], str]:
+    """
+    Returns:
+        tuple: (skills, sha256 of the file contents). The hash identifies the
+        dictionary version, so a compiled matcher can be reused until the
+        file actually changes.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    skills = [line.strip() for line in data.decode("utf-8").splitlines() if line.strip()]
+    return skills, hashlib.sha256(data).hexdigest()
+
+
+def build_matcher(nlp, skills_list):
+    """
+    Compiles the skills dictionary into a case-insensitive PhraseMatcher.
+    Patterns only need tokenizing, so they go through nlp.tokenizer.pipe
+    rather than one make_doc call per entry.
+    """
+    matcher = PhraseMatcher(nlp.vocab, attr="LOWER")
+    matcher.add("SKILLS", list(nlp.tokenizer.pipe(skills_list)))
+    return matcher
+
+
+def match_skills(doc, matcher) -> List[str]:
+    """
+    Returns:
+        list: Sorted unique skill mentions found in an already-processed doc
+    """
+    return sorted(set(doc[start:end].text for _, start, end in matcher(doc)))
+
+
+def match_text(nlp, matcher, text: str, tokenizer_only: bool = True) -> List[str]:
+    """
+    Matches one text. PhraseMatcher on attr="LOWER" only looks at tokens, so
+    by default the tagger/parser/NER are skipped (same matches, much less
+    work); pass tokenizer_only=False to run the full pipeline.
+    """
+    doc = nlp.make_doc(text) if tokenizer_only else nlp(text)
+    return match_skills(doc, matcher)
+
+
+def match_batch(nlp, matcher, texts: Iterable[str], batch_size: int = 256,
+                n_process: int = 1, tokenizer_only: bool = True) -> List[List[str]]:
+    """
+    Matches many texts through nlp.pipe. With tokenizer_only every pipeline
+    component is disabled; a single process uses the tokenizer's own pipe.
+    """
+    if tokenizer_only and n_process == 1:
+        docs = nlp.tokenizer.pipe(texts, batch_size=batch_size)
+    elif tokenizer_only:
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process, disable=nlp.pipe_names)
+    else:
+        docs = nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+    return [match_skills(doc, matcher) for doc in docs]
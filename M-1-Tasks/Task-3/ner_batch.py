@@ -0,0 +1,108 @@
+# Task-3/ner_batch.py
+"""
+Batch inference with the trained SKILL / SOFT_SKILL NER model.
+
+Streams texts through nlp.pipe (optionally across several processes) and
+writes one JSON line per text with its entities:
+
+    {"id": "...", "entities": [{"start": 23, "end": 29, "label": "SKILL", "text": "Python"}]}
+
+The source can be a directory of .txt files, a JSONL file of
+{"id": ..., "text": ...} objects, or a Task-1 corpus directory
+(parse_and_clean.py --corpus). Texts are read lazily and results are
+written as they come out of the pipe, so memory stays bounded by
+batch_size x n_process whatever the corpus size.
+
+    python ner_batch.py ../Task-1/outputs -o entities.jsonl --n-process 4
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from typing import Iterator, Optional, Tuple
+
+from ner_training import MODEL_DIR, load_model
+
+BASE_DIR = os.path.dirname(__file__)
+sys.path.append(os.path.join(BASE_DIR, "../Task-1"))
+
+
+def iter_texts(source: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (id, text) pairs from a directory, JSONL file or corpus store.
+    """
+    if os.path.isdir(source) and os.path.exists(os.path.join(source, "corpus.idx")):
+        from corpus_store import CorpusReader
+
+        with CorpusReader(source) as corpus:
+            for batch in corpus.scan(columns=("source", "cleaned"), decode=True):
+                yield from zip(batch["source"], batch["cleaned"])
+    elif os.path.isdir(source):
+        for path in sorted(glob.glob(os.path.join(source, "**", "*.txt"), recursive=True)):
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                yield os.path.relpath(path, source), f.read()
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    record = json.loads(line)
+                    yield str(record.get("id", line_no)), record["text"]
+
+
+def tag_corpus(nlp, source: str, output_path: str, batch_size: int = 64, n_process: int = 1,
+               progress_every: int = 500, limit: Optional[int] = None) -> int:
+    """
+    Returns:
+        int: Number of texts tagged
+    """
+    max_length = nlp.max_length
+    skipped = []
+
+    def inputs():
+        for count, (doc_id, text) in enumerate(iter_texts(source)):
+            if limit is not None and count >= limit:
+                return
+            if len(text) > max_length:
+                skipped.append(doc_id)
+                continue
+            yield text, doc_id
+
+    start = time.perf_counter()
+    count = 0
+    with open(output_path, "w", encoding="utf-8") as out:
+        for doc, doc_id in nlp.pipe(inputs(), as_tuples=True, batch_size=batch_size, n_process=n_process):
+            entities = [
+                {"start": ent.start_char, "end": ent.end_char, "label": ent.label_, "text": ent.text}
+                for ent in doc.ents
+            ]
+            out.write(json.dumps({"id": doc_id, "entities": entities}, ensure_ascii=False) + "\n")
+            count += 1
+            if progress_every and count % progress_every == 0:
+                elapsed = time.perf_counter() - start
+                print(f"  {count} texts, {count / elapsed:.1f} texts/sec", file=sys.stderr, flush=True)
+
+    elapsed = time.perf_counter() - start
+    print(f"✅ Tagged {count} texts in {elapsed:.1f}s ({count / max(elapsed, 1e-9):.1f} texts/sec) -> {output_path}")
+    if skipped:
+        print(f"❌ Skipped {len(skipped)} texts longer than {max_length} characters: {skipped[:5]}")
+    return count
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tag a corpus with the SKILL/SOFT_SKILL NER model")
+    parser.add_argument("source", help="directory of .txt files, JSONL of {id, text}, or a Task-1 corpus dir")
+    parser.add_argument("-o", "--output", default="entities.jsonl")
+    parser.add_argument("-m", "--model", default=MODEL_DIR)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--n-process", type=int, default=1)
+    parser.add_argument("--progress-every", type=int, default=500)
+    parser.add_argument("--limit", type=int)
+    args = parser.parse_args()
+
+    nlp = load_model(args.model)
+    if nlp is None:
+        parser.error(f"No trained model in {args.model}; run ner_training.py first")
+    tag_corpus(nlp, args.source, args.output, args.batch_size, args.n_process,
+               args.progress_every, args.limit)
@@ -0,0 +1,256 @@
+# Task-3/ner_training.py
+"""
+Offline training for the SKILL / SOFT_SKILL NER model.
+
+Trains the model once and writes it with nlp.to_disk() plus a
+training_meta.json, so the Streamlit app (custom_ner.py) only has to load
+it at startup:
+
+    python ner_training.py [-o models/skill_ner] [--data train.jsonl] [--max-epochs 30]
+"""
+import datetime
+import hashlib
+import json
+import os
+import random
+import shutil
+import time
+from typing import Callable, List, Optional
+
+import spacy
+from spacy.training.example import Example
+from spacy.util import minibatch
+from thinc.api import compounding
+
+BASE_DIR = os.path.dirname(__file__)
+MODEL_DIR = os.path.join(BASE_DIR, "models", "skill_ner")
+META_NAME = "training_meta.json"
+LABELS = ("SKILL", "SOFT_SKILL")
+DEFAULT_MAX_EPOCHS = 30
+
+# -----------------------
+# Training data
+# -----------------------
+TRAIN_DATA = [
+    ("I have experience with Python programming.", {"entities": [(23, 29, "SKILL")]}),
+    ("Worked on SQL databases and data analysis.", {"entities": [(10, 13, "SKILL"), (28, 41, "SKILL")]}),
+    ("Excellent communication and leadership qualities.", {"entities": [(10, 23, "SOFT_SKILL"), (28, 38, "SOFT_SKILL")]}),
+    ("Proficient in Java and cloud computing.", {"entities": [(14, 18, "SKILL"), (23, 38, "SKILL")]}),
+    ("Good problem solving and critical thinking.", {"entities": [(5, 20, "SOFT_SKILL"), (25, 42, "SOFT_SKILL")]}),
+    ("Hands-on experience with Excel and Power BI.", {"entities": [(25, 30, "SKILL"), (35, 43, "SKILL")]}),
+    ("Strong teamwork and collaboration skills.", {"entities": [(7, 15, "SOFT_SKILL"), (20, 33, "SOFT_SKILL")]}),
+    ("Knowledge of machine learning and deep learning.", {"entities": [(13, 29, "SKILL"), (34, 47, "SKILL")]}),
+    ("Skilled in time management and adaptability.", {"entities": [(11, 26, "SOFT_SKILL"), (31, 43, "SOFT_SKILL")]}),
+    ("Experienced in project management and Python.", {"entities": [(15, 33, "SOFT_SKILL"), (38, 44, "SKILL")]}),
+]
+
+
+def data_hash(train_data) -> str:
+    return hashlib.sha256(json.dumps(train_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_jsonl_data(path: str):
+    """
+    Reads training data written one {"text": ..., "entities": [[start, end, label], ...]}
+    object per line, for corpora too large to keep in this file.
+    """
+    data = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                data.append((record["text"], {"entities": [tuple(e) for e in record["entities"]]}))
+    return data
+
+
+# -----------------------
+# Training pipeline
+# -----------------------
+def make_examples(nlp, data) -> List[Example]:
+    """
+    Converts (text, annotations) pairs to Examples once, tokenizing in
+    batches; the same Examples are reused every epoch.
+    """
+    docs = nlp.tokenizer.pipe(text for text, _ in data)
+    return [Example.from_dict(doc, annotations) for doc, (_, annotations) in zip(docs, data)]
+
+
+def split_dev(data, dev_fraction: float, seed: int):
+    """
+    Returns:
+        tuple: (train, dev) after a seeded shuffle; dev is empty when the
+        data is too small to hold anything out
+    """
+    data = list(data)
+    random.Random(seed).shuffle(data)
+    n_dev = int(len(data) * dev_fraction)
+    return data[n_dev:], data[:n_dev]
+
+
+def evaluate_ents_f(nlp, dev_examples: List[Example]) -> float:
+    # Fresh predicted docs each time: NER keeps entities already set on a doc
+    fresh = [Example(nlp.make_doc(eg.reference.text), eg.reference) for eg in dev_examples]
+    return nlp.evaluate(fresh)["ents_f"] or 0.0
+
+
+def train_ner(train_data=TRAIN_DATA, dev_data=None, max_epochs: int = DEFAULT_MAX_EPOCHS,
+              patience: int = 5, dev_fraction: float = 0.2, batch_start: float = 4.0,
+              batch_stop: float = 32.0, batch_compound: float = 1.001, drop: float = 0.2,
+              seed: int = 0, progress: Optional[Callable[[str], None]] = print):
+    """
+    Minibatched training with batch sizes compounding from `batch_start` to
+    `batch_stop`, a reshuffle every epoch, and early stopping once the dev
+    entity F-score has not improved for `patience` epochs. The best epoch's
+    weights are restored. Without `dev_data`, `dev_fraction` of the training
+    data is held out; with no dev set at all every epoch runs.
+
+    Returns:
+        tuple: (Language with a trained "ner" component, per-epoch history)
+    """
+    if dev_data is None:
+        train_data, dev_data = split_dev(train_data, dev_fraction, seed)
+
+    nlp = spacy.blank("en")  # start with a blank English model
+    ner = nlp.add_pipe("ner")
+    for label in LABELS:
+        ner.add_label(label)
+
+    train_examples = make_examples(nlp, train_data)
+    dev_examples = make_examples(nlp, dev_data)
+    optimizer = nlp.initialize(lambda: train_examples)
+
+    rng = random.Random(seed)
+    sizes = compounding(batch_start, batch_stop, batch_compound)
+    history = []
+    best_f, best_epoch, best_weights = -1.0, 0, None
+
+    for epoch in range(1, max_epochs + 1):
+        epoch_start = time.perf_counter()
+        rng.shuffle(train_examples)
+        losses = {}
+        for batch in minibatch(train_examples, size=sizes):
+            nlp.update(batch, drop=drop, sgd=optimizer, losses=losses)
+        train_seconds = time.perf_counter() - epoch_start
+
+        ents_f = evaluate_ents_f(nlp, dev_examples) if dev_examples else None
+        stats = {
+            "epoch": epoch,
+            "loss": round(losses.get("ner", 0.0), 4),
+            "ents_f": None if ents_f is None else round(ents_f, 4),
+            "examples_per_sec": round(len(train_examples) / train_seconds, 1),
+            "seconds": round(time.perf_counter() - epoch_start, 3),
+        }
+        history.append(stats)
+        if progress:
+            score = "-" if ents_f is None else f"{ents_f:.3f}"
+            progress(f"Epoch {epoch:>3}  loss {stats['loss']:>10.3f}  ents_f {score:>5}  "
+                     f"{stats['examples_per_sec']:>8,.0f} ex/s  {stats['seconds']:.2f}s")
+
+        if ents_f is None:
+            continue
+        if ents_f > best_f:
+            best_f, best_epoch, best_weights = ents_f, epoch, nlp.to_bytes()
+        elif epoch - best_epoch >= patience:
+            if progress:
+                progress(f"Early stop: no ents_f improvement since epoch {best_epoch} ({best_f:.3f})")
+            break
+
+    if best_weights is not None:
+        nlp.from_bytes(best_weights)
+    nlp.meta["name"] = "skill_ner"
+    nlp.meta["labels"] = {"ner": list(LABELS)}
+    nlp.meta["train_examples"] = len(train_examples)
+    nlp.meta["dev_examples"] = len(dev_examples)
+    return nlp, history
+
+
+def summarize(history) -> dict:
+    """
+    Returns:
+        dict: Training facts for training_meta.json
+    """
+    scored = [h for h in history if h["ents_f"] is not None]
+    best = max(scored, key=lambda h: h["ents_f"]) if scored else (history[-1] if history else {})
+    return {
+        "epochs_run": len(history),
+        "best_epoch": best.get("epoch"),
+        "best_ents_f": best.get("ents_f"),
+        "train_seconds": round(sum(h["seconds"] for h in history), 2),
+        "history": history,
+    }
+
+
+def save_model(nlp, model_dir: str = MODEL_DIR, **training_info):
+    """
+    Writes the pipeline with to_disk() and a training_meta.json next to it
+    into a temporary directory, then swaps that into place, so an
+    interrupted save never leaves a half-written model behind the previous
+    metadata.
+    """
+    tmp_dir, old_dir = model_dir + ".tmp", model_dir + ".old"
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    nlp.to_disk(tmp_dir)
+    meta = {
+        "labels": list(LABELS),
+        "spacy_version": spacy.__version__,
+        "trained_at": datetime.datetime.now().isoformat(timespec="seconds"),
+        "train_examples": nlp.meta.get("train_examples"),
+        "dev_examples": nlp.meta.get("dev_examples"),
+        **training_info,
+    }
+    with open(os.path.join(tmp_dir, META_NAME), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+
+    # A directory cannot be replaced while it has contents: move the old
+    # model aside first; load_model() falls back to it if we stop in between
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(model_dir):
+        os.replace(model_dir, old_dir)
+    os.replace(tmp_dir, model_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+
+
+def load_meta(model_dir: str = MODEL_DIR) -> dict:
+    try:
+        with open(os.path.join(model_dir, META_NAME), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def load_model(model_dir: str = MODEL_DIR):
+    """
+    Returns:
+        Language: The saved pipeline, or None when no complete artifact
+        exists (save_model() only moves complete models into place)
+    """
+    for path in (model_dir, model_dir + ".old"):
+        if load_meta(path):
+            return spacy.load(path)
+    return None
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Train the SKILL/SOFT_SKILL NER model and save it")
+    parser.add_argument("-o", "--output", default=MODEL_DIR)
+    parser.add_argument("--data", help="JSONL training data (default: TRAIN_DATA in this file)")
+    parser.add_argument("--dev", help="JSONL dev data (default: hold out --dev-fraction of the data)")
+    parser.add_argument("--dev-fraction", type=float, default=0.2)
+    parser.add_argument("--max-epochs", type=int, default=DEFAULT_MAX_EPOCHS)
+    parser.add_argument("--patience", type=int, default=5)
+    parser.add_argument("--batch-start", type=float, default=4.0)
+    parser.add_argument("--batch-stop", type=float, default=32.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    train_data = load_jsonl_data(args.data) if args.data else TRAIN_DATA
+    dev_data = load_jsonl_data(args.dev) if args.dev else None
+    start = time.perf_counter()
+    nlp, history = train_ner(train_data, dev_data, max_epochs=args.max_epochs, patience=args.patience,
+                             dev_fraction=args.dev_fraction, batch_start=args.batch_start,
+                             batch_stop=args.batch_stop, seed=args.seed)
+    elapsed = time.perf_counter() - start
+    save_model(nlp, args.output, train_data_sha256=data_hash(train_data), **summarize(history))
+    print(f"✅ Trained in {elapsed:.1f}s, saved to {args.output}")
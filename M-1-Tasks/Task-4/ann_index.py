@@ -0,0 +1,172 @@
+# Task-4/ann_index.py
+"""
+IVF (inverted file) approximate nearest-neighbour index for skill
+embeddings, CPU only and pure NumPy.
+
+Vectors are clustered with spherical k-means into `n_lists` lists. A query
+is compared with the centroids first, then only with the vectors of its
+`nprobe` closest lists. Raising nprobe trades latency for recall
+(nprobe == n_lists is exact). Each list is stored contiguously as a
+CompactMatrix (float32, float16 or int8, see compact_vectors.py), and the
+index is a directory of .npy files opened memory-mapped, like
+taxonomy_index.py. Building from a compact taxonomy reads its rows block by
+block and keeps the grouped copy in the same compact dtype.
+
+    python ann_index.py build [-t taxonomy] [--n-lists 256]
+"""
+import json
+import os
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from compact_vectors import CompactMatrix, top_k_indices
+from taxonomy_index import DEFAULT_INDEX_DIR, IVF_DIR_NAME, l2_normalize
+
+_ASSIGN_BLOCK = 8192
+VECTORS_PREFIX = "vectors"
+
+
+def _assign(vectors: Union[np.ndarray, CompactMatrix], centroids: np.ndarray) -> np.ndarray:
+    labels = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), _ASSIGN_BLOCK):
+        stop = min(start + _ASSIGN_BLOCK, len(vectors))
+        if isinstance(vectors, CompactMatrix):
+            block = vectors.rows(start, stop)
+        else:
+            block = np.asarray(vectors[start:stop], dtype=np.float32)
+        labels[start:stop] = np.argmax(block @ centroids.T, axis=1)
+    return labels
+
+
+def spherical_kmeans(vectors: np.ndarray, n_clusters: int, n_iter: int = 20,
+                     seed: int = 0) -> np.ndarray:
+    """
+    Returns:
+        np.ndarray: (n_clusters, dim) unit-norm centroids
+    """
+    rng = np.random.default_rng(seed)
+    centroids = l2_normalize(vectors[rng.choice(len(vectors), n_clusters, replace=False)])
+    for _ in range(n_iter):
+        labels = _assign(vectors, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, vectors)
+        counts = np.bincount(labels, minlength=n_clusters)
+        empty = counts == 0
+        if empty.any():
+            # Reseed empty clusters with random points so no list goes unused
+            sums[empty] = vectors[rng.choice(len(vectors), int(empty.sum()), replace=False)]
+        centroids = l2_normalize(sums)
+    return centroids
+
+
+class IVFIndex:
+    def __init__(self, centroids: np.ndarray, vectors: CompactMatrix, ids: np.ndarray,
+                 offsets: np.ndarray, nprobe: int = 8, source_hash: Optional[str] = None):
+        self.centroids = centroids
+        self.vectors = vectors      # grouped by list, list i = rows offsets[i]:offsets[i + 1]
+        self.ids = ids              # original row of each grouped vector
+        self.offsets = offsets
+        self.nprobe = nprobe
+        self.source_hash = source_hash   # taxonomy_index.labels_hash() of the vectors it was built from
+
+    @property
+    def n_lists(self) -> int:
+        return len(self.centroids)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def build(cls, vectors: Union[np.ndarray, CompactMatrix], n_lists: Optional[int] = None,
+              nprobe: int = 8, n_iter: int = 20, train_size: int = 256, seed: int = 0,
+              dtype: str = "float32") -> "IVFIndex":
+        """
+        Args:
+            vectors: (n, dim) embeddings, normalized and stored as `dtype`; or
+                a CompactMatrix of unit vectors (e.g. TaxonomyIndex.vectors),
+                read block by block and kept in its own dtype
+            n_lists: Number of clusters (default ~sqrt(n))
+            train_size: k-means trains on at most train_size x n_lists points
+        """
+        if not isinstance(vectors, CompactMatrix):
+            vectors = CompactMatrix.from_vectors(vectors, dtype)
+        n_lists = min(n_lists or max(1, int(np.sqrt(len(vectors)))), len(vectors))
+        rng = np.random.default_rng(seed)
+        sample_size = min(len(vectors), train_size * n_lists)
+        sample = vectors.take(np.sort(rng.choice(len(vectors), sample_size, replace=False)))
+        centroids = spherical_kmeans(sample.rows(0, len(sample)), n_lists, n_iter, seed)
+
+        labels = _assign(vectors, centroids)
+        order = np.argsort(labels, kind="stable")
+        offsets = np.zeros(n_lists + 1, dtype=np.int64)
+        np.cumsum(np.bincount(labels, minlength=n_lists), out=offsets[1:])
+        return cls(centroids, vectors.take(order), order.astype(np.int64), offsets, nprobe)
+
+    def query(self, query_vectors: np.ndarray, k: int = 3,
+              nprobe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns:
+            tuple: (ids, scores) shaped (queries, k), best first; rows with
+            fewer than k candidates are padded with id -1 and score -inf
+        """
+        queries = l2_normalize(np.atleast_2d(query_vectors))
+        nprobe = min(nprobe or self.nprobe, self.n_lists)
+        probe_lists, _ = top_k_indices(queries @ self.centroids.T, nprobe)
+
+        ids = np.full((len(queries), k), -1, dtype=np.int64)
+        scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        for row, (query, lists) in enumerate(zip(queries, probe_lists)):
+            spans = [(self.offsets[l], self.offsets[l + 1]) for l in lists]
+            candidates = np.concatenate([np.arange(a, b) for a, b in spans]) if spans else np.empty(0, np.int64)
+            if not len(candidates):
+                continue
+            # Probed lists are contiguous runs, so this reads whole pages
+            candidate_scores = np.concatenate([self.vectors.scores(query[None, :], a, b) for a, b in spans], axis=1)
+            best, best_scores = top_k_indices(candidate_scores, k)
+            ids[row, :best.shape[1]] = self.ids[candidates[best[0]]]
+            scores[row, :best.shape[1]] = best_scores[0]
+        return ids, scores
+
+    # -----------------------
+    # Persistence
+    # -----------------------
+    def save(self, index_dir: str):
+        os.makedirs(index_dir, exist_ok=True)
+        for name in ("centroids", "ids", "offsets"):
+            np.save(os.path.join(index_dir, f"{name}.npy"), np.asarray(getattr(self, name)))
+        self.vectors.save(index_dir, VECTORS_PREFIX)
+        with open(os.path.join(index_dir, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"n_lists": self.n_lists, "nprobe": self.nprobe, "size": len(self),
+                       "dtype": self.vectors.dtype, "source_hash": self.source_hash}, f)
+
+    @classmethod
+    def load(cls, index_dir: str, nprobe: Optional[int] = None) -> "IVFIndex":
+        with open(os.path.join(index_dir, "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        arrays = {name: np.load(os.path.join(index_dir, f"{name}.npy")) for name in ("centroids", "ids", "offsets")}
+        vectors = CompactMatrix.load(index_dir, VECTORS_PREFIX, meta["dtype"])
+        return cls(vectors=vectors, nprobe=nprobe or meta["nprobe"], source_hash=meta.get("source_hash"), **arrays)
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from taxonomy_index import TaxonomyIndex
+
+    parser = argparse.ArgumentParser(description="Build an IVF index over a taxonomy index")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("-t", "--taxonomy", default=DEFAULT_INDEX_DIR)
+    parser.add_argument("--n-lists", type=int)
+    parser.add_argument("--nprobe", type=int, default=8)
+    args = parser.parse_args()
+
+    taxonomy = TaxonomyIndex(args.taxonomy)
+    start = time.perf_counter()
+    index = IVFIndex.build(taxonomy.vectors, args.n_lists, args.nprobe)
+    index.source_hash = taxonomy.source_hash
+    output = os.path.join(args.taxonomy, IVF_DIR_NAME)
+    index.save(output)
+    print(f"✅ {len(index)} {index.vectors.dtype} vectors in {index.n_lists} lists, built in "
+          f"{time.perf_counter() - start:.1f}s -> {output}")
@@ -1,16 +1,44 @@
 import streamlit as st
 import pandas as pd
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 
+from compact_vectors import top_k_indices
+from embedding_backends import BACKENDS, MODEL_NAME, backend_key, int8_available, load_backend
+from embedding_cache import EmbeddingCache
+from taxonomy_index import TaxonomyIndex
+
 # ------------------------------
 # 1. Load Sentence-BERT model
 # ------------------------------
+backend = st.sidebar.selectbox(
+    "Embedding backend", BACKENDS,
+    help="int8 runs a dynamically quantized MiniLM (export it with `python embedding_backends.py export`)."
+)
+if backend == "int8" and not int8_available():
+    st.sidebar.warning("⚠️ No int8 model exported yet; using float32.")
+    backend = "float32"
+
+@st.cache_resource
+def load_model(backend):
+    return load_backend(backend)
+
+# Skills repeat across button presses (and across apps), so encodings are
+# cached in memory and on disk; only unseen skills reach the model.
 @st.cache_resource
-def load_model():
-    return SentenceTransformer("all-MiniLM-L6-v2")
+def load_encoder(backend):
+    return EmbeddingCache(load_model(backend), backend_key(backend))
 
-model = load_model()
+# Optional precomputed vocabulary (python taxonomy_index.py build), memory-mapped
+@st.cache_resource
+def load_taxonomy():
+    try:
+        taxonomy = TaxonomyIndex()
+    except FileNotFoundError:
+        return None
+    return taxonomy if taxonomy.model_name == MODEL_NAME else None
+
+encoder = load_encoder(backend)
+taxonomy = load_taxonomy()
 
 # ------------------------------
 # 2. Input Section
@@ -39,8 +67,9 @@ if st.button("Compute Similarity"):
         # ------------------------------
         # 3. Embedding Generation
         # ------------------------------
-        resume_embeddings = model.encode(resume_skills)
-        jd_embeddings = model.encode(jd_skills)
+        embeddings = encoder.encode(resume_skills + jd_skills)
+        resume_embeddings = embeddings[:len(resume_skills)]
+        jd_embeddings = embeddings[len(resume_skills):]
 
         # ------------------------------
         # 4. Similarity Matrix
@@ -50,12 +79,10 @@ if st.button("Compute Similarity"):
         # ------------------------------
         # 5. Top-3 Matches for Each Resume Skill
         # ------------------------------
+        top_indices, top_scores = top_k_indices(similarity_matrix, 3)
         results = []
         for i, res_skill in enumerate(resume_skills):
-            sim_scores = list(enumerate(similarity_matrix[i]))
-            sim_scores = sorted(sim_scores, key=lambda x: x[1], reverse=True)[:3]
-
-            for idx, score in sim_scores:
+            for idx, score in zip(top_indices[i], top_scores[i]):
                 results.append({
                     "Resume Skill": res_skill,
                     "JD Match": jd_skills[idx],
@@ -69,3 +96,17 @@ if st.button("Compute Similarity"):
         # ------------------------------
         st.subheader("📊 Top Matches (Resume → JD Skills)")
         st.dataframe(df_results)
+
+        if taxonomy is not None:
+            tax_indices, tax_scores = taxonomy.top_k(resume_embeddings, 3)
+            st.subheader(f"🧭 Closest Skills in Taxonomy ({len(taxonomy)} skills)")
+            st.dataframe(pd.DataFrame([
+                {"Resume Skill": res_skill, "Taxonomy Skill": taxonomy.labels[idx],
+                 "Similarity Score": round(float(score), 3)}
+                for res_skill, row_idx, row_scores in zip(resume_skills, tax_indices, tax_scores)
+                for idx, score in zip(row_idx, row_scores) if idx >= 0
+            ]))
+
+        stats = encoder.stats()
+        st.caption(f"Embedding cache: {stats['hit_rate']:.0%} hit rate "
+                   f"({stats['memory_hits']} memory, {stats['disk_hits']} disk, {stats['misses']} encoded)")
@@ -0,0 +1,79 @@
+# Task-4/bench_ann.py
+"""
+Benchmark: IVF approximate search vs exact brute-force cosine top-k.
+
+Reports recall@k (share of the exact top-k that the index returns) and
+queries/sec for several nprobe settings. Uses a built taxonomy index when
+given, otherwise a synthetic clustered set shaped like MiniLM embeddings.
+
+    python bench_ann.py [--taxonomy taxonomy] [--size 100000] [-k 10] [--nprobe 1 4 16 64] [--dtype int8]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from ann_index import IVFIndex
+from compact_vectors import DTYPES, top_k_indices
+from taxonomy_index import TaxonomyIndex, l2_normalize
+
+
+def synthetic(size: int, dim: int, clusters: int, seed: int) -> np.ndarray:
+    # Skill embeddings are strongly clustered (languages, cloud, soft skills...)
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dim)).astype(np.float32)
+    members = rng.integers(0, clusters, size)
+    return l2_normalize(centers[members] + 0.6 * rng.standard_normal((size, dim)).astype(np.float32))
+
+
+def exact_top_k(matrix: np.ndarray, queries: np.ndarray, k: int, block: int = 256) -> np.ndarray:
+    return np.vstack([top_k_indices(queries[i:i + block] @ matrix.T, k)[0]
+                      for i in range(0, len(queries), block)])
+
+
+def recall_at_k(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / truth.size
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--taxonomy", help="taxonomy index directory (default: synthetic data)")
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--n-lists", type=int)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 8, 16, 64])
+    parser.add_argument("--dtype", choices=list(DTYPES), default="float32", help="IVF vector storage")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed + 1)
+    if args.taxonomy:
+        matrix = np.asarray(TaxonomyIndex(args.taxonomy).matrix)
+    else:
+        matrix = synthetic(args.size, args.dim, max(1, args.size // 500), args.seed)
+    # Queries are perturbed vocabulary entries: near a real skill, not on it
+    picks = rng.integers(0, len(matrix), args.queries)
+    queries = l2_normalize(matrix[picks] + 0.3 * rng.standard_normal(matrix[picks].shape).astype(np.float32))
+
+    index, build_seconds = timed(lambda: IVFIndex.build(matrix, args.n_lists, dtype=args.dtype))
+    print(f"{len(matrix)} vectors x {matrix.shape[1]} dims, {index.n_lists} lists "
+          f"(built in {build_seconds:.1f}s), {len(queries)} queries, k={args.k}\n")
+
+    truth, exact_seconds = timed(lambda: exact_top_k(matrix, queries, args.k))
+    print(f"{'exact (matrix product)':<24} recall@{args.k} 1.000  {len(queries) / exact_seconds:10.1f} QPS (batched)")
+    _, single_seconds = timed(lambda: [exact_top_k(matrix, q[None, :], args.k) for q in queries[:100]])
+    print(f"{'exact, one at a time':<24} {'':13}  {100 / single_seconds:10.1f} QPS")
+
+    for nprobe in args.nprobe:
+        (found, _), seconds = timed(lambda: index.query(queries, args.k, nprobe))
+        print(f"{'ivf nprobe=' + str(nprobe):<24} recall@{args.k} {recall_at_k(found, truth):.3f}  "
+              f"{len(queries) / seconds:10.1f} QPS")
@@ -0,0 +1,72 @@
+# Task-4/bench_backends.py
+"""
+Benchmark: float32 vs int8 MiniLM embedding backends.
+
+Reports sentences/sec for each backend, the cosine between the two
+backends' vectors for the same text, and top-k agreement: for each query
+skill, the share of its k nearest vocabulary skills under float32 that the
+int8 model also puts in its top k.
+
+    python bench_backends.py [--vocab ../Task-2/skills_dict.txt] [-k 5] [--repeat 3]
+"""
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from compact_vectors import top_k_indices
+from embedding_backends import REFERENCE_TEXTS, load_backend
+from taxonomy_index import l2_normalize
+
+
+def throughput(model, texts, batch_size: int, repeat: int) -> float:
+    model.encode(texts[:batch_size], batch_size=batch_size)   # warm-up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.encode(texts, batch_size=batch_size)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) / best
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--vocab", help="one skill per line (default: reference skills x phrasings)")
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threads", type=int, help="torch.set_num_threads")
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    if args.vocab:
+        with open(args.vocab, "r", encoding="utf-8") as f:
+            vocab = list(dict.fromkeys(line.strip() for line in f if line.strip()))
+    else:
+        templates = ["{}", "experience with {}", "strong {} skills", "{} (3+ years)", "certified in {}"]
+        vocab = [t.format(skill) for skill in REFERENCE_TEXTS for t in templates]
+
+    float32_model = load_backend("float32")
+    int8_model = load_backend("int8")
+
+    print(f"{len(vocab)} texts, batch size {args.batch_size}, {torch.get_num_threads()} threads\n")
+    results = {}
+    for name, model in (("float32", float32_model), ("int8", int8_model)):
+        rate = throughput(model, vocab, args.batch_size, args.repeat)
+        results[name] = l2_normalize(model.encode(vocab, batch_size=args.batch_size))
+        print(f"{name:<8} {rate:9.1f} sentences/sec")
+
+    cosines = np.sum(results["float32"] * results["int8"], axis=1)
+    print(f"\ncosine(float32, int8): mean {cosines.mean():.4f}  min {cosines.min():.4f}")
+
+    k = min(args.k, len(vocab) - 1)
+    neighbours = {}
+    for name, vectors in results.items():
+        scores = vectors @ vectors.T
+        np.fill_diagonal(scores, -np.inf)   # a text is not its own neighbour
+        neighbours[name] = top_k_indices(scores, k)[0]
+    agreement = np.mean([len(set(a) & set(b)) / k for a, b in zip(neighbours["float32"], neighbours["int8"])])
+    top1 = np.mean(neighbours["float32"][:, 0] == neighbours["int8"][:, 0])
+    print(f"top-{k} agreement {agreement:.3f}, top-1 agreement {top1:.3f}")
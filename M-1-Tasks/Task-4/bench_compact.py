@@ -0,0 +1,54 @@
+# Task-4/bench_compact.py
+"""
+Benchmark: float16 / int8 embedding storage vs float32.
+
+For each storage format reports the matrix size, exact top-k query speed,
+and the ranking drift against float32: recall@k of the float32 top-k,
+top-1 agreement, and the largest absolute change in a cosine score.
+
+    python bench_compact.py [--taxonomy taxonomy] [--size 200000] [-k 10]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from bench_ann import synthetic
+from compact_vectors import DTYPES, CompactMatrix
+from taxonomy_index import TaxonomyIndex, l2_normalize
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--taxonomy", help="taxonomy index directory (default: synthetic data)")
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed + 1)
+    if args.taxonomy:
+        vectors = np.asarray(TaxonomyIndex(args.taxonomy).matrix, dtype=np.float32)
+    else:
+        vectors = synthetic(args.size, args.dim, max(1, args.size // 500), args.seed)
+    picks = rng.integers(0, len(vectors), args.queries)
+    queries = l2_normalize(vectors[picks] + 0.3 * rng.standard_normal(vectors[picks].shape).astype(np.float32))
+    print(f"{len(vectors)} vectors x {vectors.shape[1]} dims, {len(queries)} queries, k={args.k}\n")
+
+    reference = None
+    for dtype in DTYPES:
+        matrix = CompactMatrix.from_vectors(vectors, dtype)
+        start = time.perf_counter()
+        indices, scores = matrix.top_k(queries, args.k)
+        seconds = time.perf_counter() - start
+        exact_scores = matrix.scores(queries)
+        if reference is None:
+            reference = (indices, exact_scores, matrix.nbytes)
+        ref_indices, ref_scores, ref_bytes = reference
+        recall = np.mean([len(set(a) & set(b)) / args.k for a, b in zip(indices, ref_indices)])
+        top1 = np.mean(indices[:, 0] == ref_indices[:, 0])
+        drift = np.abs(exact_scores - ref_scores).max()
+        print(f"{dtype:<8} {matrix.nbytes / 2**20:8.1f} MiB ({ref_bytes / matrix.nbytes:.1f}x smaller)  "
+              f"{len(queries) / seconds:8.1f} QPS  recall@{args.k} {recall:.4f}  "
+              f"top-1 {top1:.4f}  max |score drift| {drift:.5f}")
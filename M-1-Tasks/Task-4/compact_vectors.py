@@ -0,0 +1,169 @@
+# Task-4/compact_vectors.py
+"""
+Compact storage for L2-normalized embedding matrices.
+
+- "float32": 4 bytes per dimension (reference).
+- "float16": 2 bytes per dimension; plenty for unit vectors, whose
+  components are all in [-1, 1].
+- "int8": 1 byte per dimension plus one float32 scale per vector
+  (symmetric scalar quantization: code = round(x / scale), with
+  scale = max|x| / 127, so each vector uses its full int8 range).
+
+Similarity is computed block by block: each block of stored rows is turned
+back into float32 (for int8, the codes are multiplied by the query and the
+per-row scale is applied to the scores), so the float32 copy that exists
+at any time is one block, never the whole matrix.
+"""
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+
+DTYPES = {"float32": np.float32, "float16": np.float16, "int8": np.int8}
+_SUFFIX = {"float32": "f32", "float16": "f16", "int8": "i8"}
+
+
+def matrix_file(prefix: str, dtype: str) -> str:
+    return f"{prefix}.{_SUFFIX[dtype]}.npy"
+
+
+def scales_file(prefix: str) -> str:
+    return f"{prefix}.scales.npy"
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Row-wise top-k of a 2-D score matrix, best first.
+
+    Returns:
+        tuple: (indices, scores), both shaped (rows, min(k, columns))
+    """
+    k = min(k, scores.shape[1])
+    if k <= 0:
+        empty = np.zeros((scores.shape[0], 0))
+        return empty.astype(np.int64), empty.astype(scores.dtype)
+    if k < scores.shape[1]:
+        candidates = np.argpartition(scores, -k, axis=1)[:, -k:]
+    else:
+        candidates = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind="stable")
+    return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+
+def quantize_rows(vectors: np.ndarray, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Returns:
+        tuple: (codes in `dtype`, float32 per-row scales for int8 else None)
+    """
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if dtype == "int8":
+        scales = np.abs(vectors).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(vectors / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales.astype(np.float32)
+    return vectors.astype(DTYPES[dtype]), None
+
+
+class CompactMatrix:
+    def __init__(self, codes: np.ndarray, scales: Optional[np.ndarray] = None):
+        self.codes = codes
+        self.scales = scales
+        self.dtype = next(name for name, np_type in DTYPES.items() if codes.dtype == np_type)
+        if self.dtype == "int8" and scales is None:
+            raise ValueError("int8 codes need per-vector scales")
+
+    @classmethod
+    def from_vectors(cls, vectors: np.ndarray, dtype: str = "float16") -> "CompactMatrix":
+        vectors = np.asarray(vectors, dtype=np.float32)
+        vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        return cls(*quantize_rows(vectors, dtype))
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def dim(self) -> int:
+        return self.codes.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.codes.nbytes + (self.scales.nbytes if self.scales is not None else 0)
+
+    # -----------------------
+    # Reading
+    # -----------------------
+    def rows(self, start: int, stop: int) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: float32 copy of rows [start, stop)
+        """
+        block = np.asarray(self.codes[start:stop], dtype=np.float32)
+        if self.scales is not None:
+            block *= self.scales[start:stop, None]
+        return block
+
+    def take(self, indices: np.ndarray) -> "CompactMatrix":
+        """
+        Returns:
+            CompactMatrix: The given rows, still in the compact dtype
+        """
+        indices = np.asarray(indices)
+        return CompactMatrix(np.asarray(self.codes[indices]),
+                             None if self.scales is None else np.asarray(self.scales[indices]))
+
+    def dequantize(self) -> np.ndarray:
+        """
+        The whole matrix as float32; the stored array itself (no copy, still
+        memory-mapped) when it already is float32.
+        """
+        if self.dtype == "float32":
+            return self.codes
+        return self.rows(0, len(self))
+
+    def scores(self, queries: np.ndarray, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: (queries, rows) dot products with rows [start, stop)
+        """
+        stop = len(self) if stop is None else stop
+        queries = np.asarray(queries, dtype=np.float32)
+        block = np.asarray(self.codes[start:stop], dtype=np.float32)
+        scores = queries @ block.T
+        if self.scales is not None:
+            scores *= self.scales[start:stop]
+        return scores
+
+    def top_k(self, queries: np.ndarray, k: int, block_rows: int = 65536) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns:
+            tuple: (indices, scores) shaped (queries, k), best first; one
+            block of stored rows is dequantized at a time
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        best_idx = np.zeros((len(queries), 0), dtype=np.int64)
+        best_scores = np.zeros((len(queries), 0), dtype=np.float32)
+        for start in range(0, len(self), block_rows):
+            stop = min(start + block_rows, len(self))
+            idx, scores = top_k_indices(self.scores(queries, start, stop), k)
+            merged_idx = np.hstack([best_idx, idx + start])
+            merged_scores = np.hstack([best_scores, scores])
+            order, best_scores = top_k_indices(merged_scores, k)
+            best_idx = np.take_along_axis(merged_idx, order, axis=1)
+        return best_idx, best_scores
+
+    # -----------------------
+    # Persistence
+    # -----------------------
+    def save(self, directory: str, prefix: str = "embeddings"):
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, matrix_file(prefix, self.dtype)), np.asarray(self.codes))
+        if self.scales is not None:
+            np.save(os.path.join(directory, scales_file(prefix)), np.asarray(self.scales))
+
+    @classmethod
+    def load(cls, directory: str, prefix: str = "embeddings", dtype: str = "float32",
+             mmap: bool = True) -> "CompactMatrix":
+        codes = np.load(os.path.join(directory, matrix_file(prefix, dtype)), mmap_mode="r" if mmap else None)
+        scales = np.load(os.path.join(directory, scales_file(prefix))) if dtype == "int8" else None
+        return cls(codes, scales)
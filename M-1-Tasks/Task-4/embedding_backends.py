@@ -0,0 +1,176 @@
+# Task-4/embedding_backends.py
+"""
+Selectable embedding backends for all-MiniLM-L6-v2.
+
+- "float32": the stock SentenceTransformer (PyTorch, float32).
+- "int8": the same model with every nn.Linear dynamically quantized to int8
+  (torch.quantization.quantize_dynamic). Weights are stored as int8 and
+  activations are quantized on the fly, which is where the CPU time goes
+  in MiniLM. It is exported once to a local artifact and loaded from there:
+
+    python embedding_backends.py export [-o models/minilm-int8]
+
+  The artifact holds the float32 model directory (config, tokenizer,
+  weights) and the quantized state_dict, not a pickled module. Loading
+  needs no hub access: it builds the model from that directory, quantizes
+  its layout and loads the saved int8 weights, and refuses an artifact
+  whose weights no longer fit the installed libraries.
+
+Tolerance: the export embeds a fixed reference set of skill phrases with
+both backends and refuses to save unless every int8 vector has a cosine of
+at least MIN_COSINE (0.98) with its float32 counterpart. The measured
+mean/min cosine is stored in the artifact's metadata. bench_backends.py
+reports throughput and top-k neighbour agreement on larger sets.
+"""
+import json
+import os
+from typing import Sequence
+
+import numpy as np
+
+BASE_DIR = os.path.dirname(__file__)
+MODEL_NAME = "all-MiniLM-L6-v2"
+BACKENDS = ("float32", "int8")
+DEFAULT_INT8_DIR = os.path.join(BASE_DIR, "models", "minilm-int8")
+INT8_BASE_DIR = "base"
+INT8_STATE_FILE = "quantized_state.pt"
+INT8_META_FILE = "meta.json"
+MIN_COSINE = 0.98
+
+REFERENCE_TEXTS = [
+    "Python", "Java", "SQL", "Machine Learning", "Deep Learning", "Data Analysis",
+    "Data Visualization", "Natural Language Processing", "Computer Vision", "Power BI",
+    "Tableau", "Excel", "Communication", "Leadership", "Problem Solving", "Teamwork",
+    "Project Management", "Cloud Computing", "AWS", "Docker", "Kubernetes", "Git",
+    "Statistics", "Pandas", "NumPy", "Scikit-learn", "TensorFlow", "PyTorch",
+    "Critical Thinking", "Time Management", "REST APIs", "Agile methodologies",
+]
+
+
+def backend_key(backend: str, model_name: str = MODEL_NAME) -> str:
+    """
+    Identifies a model + backend pair; used as the embedding cache's model
+    name so float32 and int8 vectors are never mixed.
+    """
+    return model_name if backend == "float32" else f"{model_name}:{backend}"
+
+
+def _cosines(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    a = a / np.linalg.norm(a, axis=1, keepdims=True)
+    b = b / np.linalg.norm(b, axis=1, keepdims=True)
+    return np.sum(a * b, axis=1)
+
+
+def quantize(model):
+    import torch
+
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+def _library_versions() -> dict:
+    import sentence_transformers
+    import torch
+    import transformers
+
+    return {
+        "torch_version": torch.__version__,
+        "transformers_version": transformers.__version__,
+        "sentence_transformers_version": sentence_transformers.__version__,
+    }
+
+
+def export_int8(model_name: str = MODEL_NAME, output_dir: str = DEFAULT_INT8_DIR,
+                reference_texts: Sequence[str] = REFERENCE_TEXTS) -> dict:
+    """
+    Quantizes the model, checks it against float32 on `reference_texts` and
+    saves it.
+
+    Raises:
+        ValueError: If any reference embedding drifts below MIN_COSINE
+
+    Returns:
+        dict: The metadata written next to the model
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    baseline = SentenceTransformer(model_name, device="cpu")
+    reference = baseline.encode(list(reference_texts), convert_to_numpy=True)
+    quantized = quantize(baseline)
+    cosines = _cosines(reference, quantized.encode(list(reference_texts), convert_to_numpy=True))
+    if cosines.min() < MIN_COSINE:
+        raise ValueError(f"int8 model drifts too far from float32: min cosine {cosines.min():.4f} < {MIN_COSINE}")
+
+    os.makedirs(output_dir, exist_ok=True)
+    baseline.save(os.path.join(output_dir, INT8_BASE_DIR))
+    torch.save(quantized.state_dict(), os.path.join(output_dir, INT8_STATE_FILE))
+    meta = {
+        "model": model_name,
+        "backend": "int8",
+        **_library_versions(),
+        "min_cosine_required": MIN_COSINE,
+        "reference_mean_cosine": round(float(cosines.mean()), 5),
+        "reference_min_cosine": round(float(cosines.min()), 5),
+    }
+    with open(os.path.join(output_dir, INT8_META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def int8_available(artifact_dir: str = DEFAULT_INT8_DIR) -> bool:
+    return all(os.path.exists(os.path.join(artifact_dir, name))
+               for name in (INT8_META_FILE, INT8_STATE_FILE, INT8_BASE_DIR))
+
+
+def load_backend(backend: str = "float32", model_name: str = MODEL_NAME,
+                 artifact_dir: str = DEFAULT_INT8_DIR):
+    """
+    Returns:
+        An object with SentenceTransformer's encode()
+
+    Raises:
+        FileNotFoundError: If the int8 artifact has not been exported
+        ValueError: If the artifact holds another model, or its int8 weights
+            do not fit the model as the installed libraries build it
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend == "float32":
+        return SentenceTransformer(model_name)
+    if backend != "int8":
+        raise ValueError(f"Unknown embedding backend: {backend} (choose from {', '.join(BACKENDS)})")
+
+    import torch
+
+    if not int8_available(artifact_dir):
+        raise FileNotFoundError(f"No int8 model in {artifact_dir}; run embedding_backends.py export")
+    with open(os.path.join(artifact_dir, INT8_META_FILE), "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta["model"] != model_name:
+        raise ValueError(f"{artifact_dir} holds {meta['model']}, not {model_name}")
+
+    model = quantize(SentenceTransformer(os.path.join(artifact_dir, INT8_BASE_DIR), device="cpu"))
+    state = torch.load(os.path.join(artifact_dir, INT8_STATE_FILE), map_location="cpu", weights_only=True)
+    try:
+        model.load_state_dict(state)
+    except RuntimeError as e:
+        # Serving anything else would skip the export's tolerance check
+        exported = {key: meta.get(key) for key in _library_versions()}
+        raise ValueError(f"int8 weights in {artifact_dir} do not fit this install (exported with "
+                         f"{exported}); re-run embedding_backends.py export") from e
+    model.eval()
+    return model
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export the int8 MiniLM backend")
+    parser.add_argument("command", choices=["export"])
+    parser.add_argument("-o", "--output", default=DEFAULT_INT8_DIR)
+    parser.add_argument("--model", default=MODEL_NAME)
+    args = parser.parse_args()
+
+    meta = export_int8(args.model, args.output)
+    print(f"✅ Saved int8 {args.model} to {args.output} "
+          f"(reference cosine mean {meta['reference_mean_cosine']}, min {meta['reference_min_cosine']})")
@@ -0,0 +1,190 @@
+# Task-4/embedding_cache.py
+"""
+Two-tier cache in front of SentenceTransformer.encode.
+
+Tier 1 is an in-process LRU of vectors; tier 2 is a SQLite file shared by
+every process and app on the host (Task-4 and Task-5 use the same one).
+Entries are keyed by model name and normalized text: NFKC, trimmed,
+whitespace collapsed and lowercased. Lowercasing is safe for
+all-MiniLM-L6-v2, whose tokenizer is uncased; pass lowercase=False for a
+cased model. Whatever misses both tiers is encoded in a single batched
+call.
+
+The SQLite tier stores vectors as float16 by default (`storage`; see
+compact_vectors.py), half the bytes of float32. Fresh encodes are returned
+after the same round trip, so a text gets the same vector whichever tier
+serves it.
+"""
+import os
+import sqlite3
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from compact_vectors import DTYPES, quantize_rows
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_CACHE_DIR = os.path.join(BASE_DIR, ".embedding_cache")
+DB_NAME = "embeddings.sqlite"
+_SQL_CHUNK = 500   # stay well under SQLite's bound-parameter limit
+
+
+def normalize_text(text: str, lowercase: bool = True) -> str:
+    text = " ".join(unicodedata.normalize("NFKC", text).split())
+    return text.lower() if lowercase else text
+
+
+def _pack(vectors: np.ndarray, storage: str) -> List[bytes]:
+    # int8 rows carry their float32 scale in front of the codes
+    codes, scales = quantize_rows(vectors, storage)
+    if scales is None:
+        return [row.tobytes() for row in codes]
+    return [scale.tobytes() + row.tobytes() for scale, row in zip(scales, codes)]
+
+
+def _unpack(blob: bytes, storage: str) -> np.ndarray:
+    if storage == "int8":
+        scale = np.frombuffer(blob, dtype=np.float32, count=1)[0]
+        return np.frombuffer(blob, dtype=np.int8, offset=4).astype(np.float32) * scale
+    return np.frombuffer(blob, dtype=DTYPES[storage]).astype(np.float32)
+
+
+class EmbeddingCache:
+    def __init__(self, model, model_name: str, cache_dir: str = DEFAULT_CACHE_DIR,
+                 max_items: int = 50_000, lowercase: bool = True, storage: str = "float16"):
+        """
+        Args:
+            model: Anything with SentenceTransformer's encode(texts, batch_size=...)
+            model_name: Part of every key, so different models never share vectors
+            cache_dir: Where the SQLite tier lives; None keeps the cache in memory only
+            storage: float32, float16 or int8 for new SQLite rows
+        """
+        if storage not in DTYPES:
+            raise ValueError(f"Unknown storage dtype: {storage}")
+        self.model = model
+        self.storage = storage
+        self.model_name = model_name
+        self.max_items = max_items
+        self.lowercase = lowercase
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "memory_hits": 0, "disk_hits": 0, "misses": 0, "encode_calls": 0}
+
+        self._db = None
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(cache_dir, DB_NAME), check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " model TEXT NOT NULL, text TEXT NOT NULL, vector BLOB NOT NULL,"
+                " dtype TEXT NOT NULL DEFAULT 'float32', PRIMARY KEY (model, text))"
+            )
+            columns = [row[1] for row in self._db.execute("PRAGMA table_info(embeddings)")]
+            if "dtype" not in columns:
+                # Caches written before rows carried a dtype hold float32 vectors
+                self._db.execute("ALTER TABLE embeddings ADD COLUMN dtype TEXT NOT NULL DEFAULT 'float32'")
+            self._db.commit()
+
+    def normalize(self, text: str) -> str:
+        return normalize_text(text, self.lowercase)
+
+    # -----------------------
+    # Tiers
+    # -----------------------
+    def _remember(self, key: str, vector: np.ndarray):
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_items:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        found = {}
+        if self._db is None:
+            return found
+        for i in range(0, len(keys), _SQL_CHUNK):
+            chunk = keys[i:i + _SQL_CHUNK]
+            rows = self._db.execute(
+                f"SELECT text, vector, dtype FROM embeddings WHERE model = ? AND text IN ({','.join('?' * len(chunk))})",
+                [self.model_name, *chunk],
+            )
+            for text, blob, dtype in rows:
+                found[text] = _unpack(blob, dtype)
+        return found
+
+    def _write_disk(self, keys: List[str], blobs: List[bytes]):
+        if self._db is None or not keys:
+            return
+        self._db.executemany(
+            "INSERT OR REPLACE INTO embeddings (model, text, vector, dtype) VALUES (?, ?, ?, ?)",
+            [(self.model_name, key, blob, self.storage) for key, blob in zip(keys, blobs)],
+        )
+        self._db.commit()
+
+    # -----------------------
+    # Encoding
+    # -----------------------
+    def encode(self, texts: Sequence[str], batch_size: int = 64) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: float32 embeddings, one row per input text, in order
+        """
+        return self.encode_with_stats(texts, batch_size)[0]
+
+    def encode_with_stats(self, texts: Sequence[str], batch_size: int = 64) -> Tuple[np.ndarray, dict]:
+        """
+        Returns:
+            tuple: (embeddings as from encode(), this call's requests /
+            memory_hits / disk_hits / misses). Unlike the deltas of stats(),
+            these are not affected by other threads sharing the cache.
+        """
+        keys = [self.normalize(text) for text in texts]
+        unique = list(dict.fromkeys(keys))
+        with self._lock:
+            vectors = {}
+            pending = []
+            for key in unique:
+                vector = self._memory.get(key)
+                if vector is None:
+                    pending.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    vectors[key] = vector
+            from_disk = self._read_disk(pending)
+            misses = [key for key in pending if key not in from_disk]
+            call = {"requests": len(texts), "memory_hits": len(vectors),
+                    "disk_hits": len(from_disk), "misses": len(misses)}
+            for name, count in call.items():
+                self._stats[name] += count
+
+            encoded = {}
+            if misses:
+                self._stats["encode_calls"] += 1
+                rows = np.asarray(self.model.encode(misses, batch_size=batch_size), dtype=np.float32)
+                blobs = _pack(rows, self.storage)
+                encoded = {key: _unpack(blob, self.storage) for key, blob in zip(misses, blobs)}
+                self._write_disk(misses, blobs)
+
+            for key, vector in {**from_disk, **encoded}.items():
+                self._remember(key, vector)
+                vectors[key] = vector
+
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32), call
+        return np.stack([vectors[key] for key in keys]), call
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+        stats["memory_items"] = len(self._memory)
+        return stats
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
@@ -0,0 +1,191 @@
+# Task-4/taxonomy_index.py
+"""
+Precomputed skill-taxonomy embeddings for fast top-k matching.
+
+The known-skill vocabulary is embedded once, offline, into an L2-normalized
+float32 matrix saved as a .npy file. At query time it is opened with
+mmap_mode="r", so nothing is copied into the process and every app process
+shares the same page-cache pages. Cosine similarity is then a single matrix
+product, and top-k uses argpartition (linear in the vocabulary size)
+instead of sorting whole rows. The matrix can also be stored as float16 or
+int8 (see compact_vectors.py) to cut its size by 2x or ~4x.
+
+    python taxonomy_index.py build [skills.txt] [-o taxonomy] [--dtype float16]
+    python taxonomy_index.py query "Python" "Data Analysis" [-k 5]
+"""
+import hashlib
+import json
+import os
+import shutil
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from compact_vectors import DTYPES, CompactMatrix, matrix_file, quantize_rows, scales_file
+
+BASE_DIR = os.path.dirname(__file__)
+DEFAULT_INDEX_DIR = os.path.join(BASE_DIR, "taxonomy")
+DEFAULT_SKILLS_FILE = os.path.join(BASE_DIR, "../Task-2/skills_dict.txt")
+MATRIX_PREFIX = "embeddings"
+MATRIX_NAME = matrix_file(MATRIX_PREFIX, "float32")
+LABELS_NAME = "labels.json"
+IVF_DIR_NAME = "ivf"
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def labels_hash(model_name: str, labels: Sequence[str]) -> str:
+    """
+    Identifies the embedded vocabulary, so derived indexes (ivf/) can tell
+    whether they were built from the current taxonomy.
+    """
+    payload = json.dumps({"model": model_name, "labels": list(labels)}, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def build_taxonomy(skills: Sequence[str], encoder, model_name: str, index_dir: str = DEFAULT_INDEX_DIR,
+                   batch_size: int = 1024, dtype: str = "float32"):
+    """
+    Embeds `skills` in batches straight into a memory-mapped .npy file, so
+    building never holds more than one batch of vectors in memory.
+    `encoder` is a SentenceTransformer or an EmbeddingCache; `dtype` is a
+    storage format from compact_vectors (float32, float16 or int8).
+    """
+    skills = list(dict.fromkeys(skills))
+    os.makedirs(index_dir, exist_ok=True)
+    # An IVF index over the previous vectors would return stale row ids
+    shutil.rmtree(os.path.join(index_dir, IVF_DIR_NAME), ignore_errors=True)
+    codes = None
+    scales = []
+    matrix_path = os.path.join(index_dir, matrix_file(MATRIX_PREFIX, dtype))
+    tmp_path = matrix_path + ".tmp"
+    for start in range(0, len(skills), batch_size):
+        block, block_scales = quantize_rows(l2_normalize(encoder.encode(skills[start:start + batch_size])), dtype)
+        if codes is None:
+            codes = np.lib.format.open_memmap(tmp_path, mode="w+", dtype=DTYPES[dtype],
+                                              shape=(len(skills), block.shape[1]))
+        codes[start:start + len(block)] = block
+        if block_scales is not None:
+            scales.append(block_scales)
+    if codes is None:
+        raise ValueError("Cannot build a taxonomy index from an empty skill list")
+    codes.flush()
+    dim = codes.shape[1]
+    del codes
+    if scales:
+        np.save(os.path.join(index_dir, scales_file(MATRIX_PREFIX)), np.concatenate(scales))
+    os.replace(tmp_path, matrix_path)
+    with open(os.path.join(index_dir, LABELS_NAME), "w", encoding="utf-8") as f:
+        json.dump({"model": model_name, "dim": dim, "dtype": dtype, "labels": skills}, f, ensure_ascii=False)
+
+
+class TaxonomyIndex:
+    def __init__(self, index_dir: str = DEFAULT_INDEX_DIR):
+        """
+        Raises:
+            FileNotFoundError: If the index has not been built
+        """
+        with open(os.path.join(index_dir, LABELS_NAME), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        self.model_name = meta["model"]
+        self.labels: List[str] = meta["labels"]
+        self.source_hash = labels_hash(self.model_name, self.labels)
+        self.vectors = CompactMatrix.load(index_dir, MATRIX_PREFIX, meta.get("dtype", "float32"))
+        # Approximate search when an IVF index was built (python ann_index.py build)
+        self.ann = None
+        ivf_dir = os.path.join(index_dir, IVF_DIR_NAME)
+        if os.path.exists(os.path.join(ivf_dir, "meta.json")):
+            from ann_index import IVFIndex
+
+            ann = IVFIndex.load(ivf_dir)
+            if len(ann) == len(self.labels) and ann.source_hash == self.source_hash:
+                self.ann = ann
+            else:
+                print(f"⚠️ Ignoring stale IVF index in {ivf_dir}; rebuild it with: python ann_index.py build")
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        float32 vectors; the memory-mapped file itself for a float32 index,
+        a dequantized copy for float16/int8.
+        """
+        return self.vectors.dequantize()
+
+    def top_k(self, query_vectors: np.ndarray, k: int = 3, query_block: int = 256,
+              exact: bool = False):
+        """
+        Returns:
+            tuple: (indices, scores) shaped (queries, k); cosine scores.
+            Uses the IVF index when there is one, unless `exact`. Exact
+            queries are processed `query_block` at a time against blocks of
+            stored rows, so the score buffer stays at query_block x 65536
+            floats whatever the vocabulary size.
+        """
+        if self.ann is not None and not exact:
+            return self.ann.query(query_vectors, k)
+        queries = l2_normalize(np.atleast_2d(query_vectors))
+        all_indices, all_scores = [], []
+        for start in range(0, len(queries), query_block):
+            indices, best = self.vectors.top_k(queries[start:start + query_block], k)
+            all_indices.append(indices)
+            all_scores.append(best)
+        if not all_indices:
+            return np.zeros((0, 0), dtype=np.int64), np.zeros((0, 0), dtype=np.float32)
+        return np.vstack(all_indices), np.vstack(all_scores)
+
+    def search(self, encoder, texts: Sequence[str], k: int = 3) -> List[List[Tuple[str, float]]]:
+        """
+        Returns:
+            list: For each text, its k closest taxonomy skills as (label, score)
+        """
+        indices, scores = self.top_k(encoder.encode(list(texts)), k)
+        return [
+            [(self.labels[i], float(s)) for i, s in zip(row_indices, row_scores) if i >= 0]
+            for row_indices, row_scores in zip(indices, scores)
+        ]
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from sentence_transformers import SentenceTransformer
+
+    from embedding_cache import EmbeddingCache
+
+    parser = argparse.ArgumentParser(description="Build or query the skill taxonomy index")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build")
+    build.add_argument("skills", nargs="?", default=DEFAULT_SKILLS_FILE, help="one skill per line")
+    build.add_argument("-o", "--output", default=DEFAULT_INDEX_DIR)
+    build.add_argument("--model", default="all-MiniLM-L6-v2")
+    build.add_argument("--dtype", choices=list(DTYPES), default="float32",
+                       help="storage format (see compact_vectors.py)")
+    query = sub.add_parser("query")
+    query.add_argument("texts", nargs="+")
+    query.add_argument("-i", "--index", default=DEFAULT_INDEX_DIR)
+    query.add_argument("-k", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.command == "build":
+        with open(args.skills, "r", encoding="utf-8") as f:
+            skills = [line.strip() for line in f if line.strip()]
+        start = time.perf_counter()
+        build_taxonomy(skills, SentenceTransformer(args.model), args.model, args.output, dtype=args.dtype)
+        print(f"✅ Embedded {len(skills)} skills in {time.perf_counter() - start:.1f}s -> {args.output}")
+    else:
+        index = TaxonomyIndex(args.index)
+        encoder = EmbeddingCache(SentenceTransformer(index.model_name), index.model_name)
+        start = time.perf_counter()
+        results = index.search(encoder, args.texts, args.k)
+        elapsed = time.perf_counter() - start
+        for text, matches in zip(args.texts, results):
+            print(f"{text}: " + ", ".join(f"{label} ({score:.3f})" for label, score in matches))
+        print(f"{len(args.texts)} queries against {len(index)} skills in {elapsed * 1000:.1f} ms")
@@ -0,0 +1,322 @@
+# Task-5/gap_engine.py
+"""
+Many-to-many skill gap analysis: N resumes x M job descriptions.
+
+Every distinct skill string is encoded once. JD skills are then scored
+against all resume skills in fixed-size blocks, and each (resume, JD
+skill) gets its best match with a segmented max, so no Python loop runs
+per pair. Strong / Partial / Missing come from vectorized thresholds.
+
+iter_gap_frames() yields the report one JD x block of resumes at a time, so
+apart from the vectors of the distinct skills, peak memory is set by one
+JD's skills x `block_cols` resume skills, not by N x M; the CLI streams
+those chunks to CSV. gap_table() and best_matches() collect everything and
+are O(N x M) in memory.
+
+    python gap_engine.py resumes.jsonl jds.jsonl -o gap_report.csv
+
+where each JSONL line is {"id": ..., "skills": ["Python", "SQL", ...]}.
+"""
+import json
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+STRONG_THRESHOLD = 0.75
+PARTIAL_THRESHOLD = 0.5
+# Default encode batch size, not a measured optimum. Skill strings are a
+# few word pieces each, so larger batches waste little on padding; compare
+# sizes with Task-4/bench_backends.py --batch-size before changing it.
+ENCODE_BATCH_SIZE = 256
+COLUMNS = ["Resume", "JD", "JD Skill", "Resume Match", "Similarity", "Status"]
+
+
+def _normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+
+def normalize_skill(text: str) -> str:
+    return " ".join(text.split()).lower()
+
+
+def encode_unique(encoder, texts: Sequence[str],
+                  batch_size: int = ENCODE_BATCH_SIZE) -> Tuple[np.ndarray, np.ndarray, dict]:
+    """
+    Normalizes `texts` (with the encoder's own normalize() when it has one,
+    e.g. EmbeddingCache), encodes each distinct form once in a single
+    batched call, and maps every input back to its row.
+
+    Returns:
+        tuple: (normalized unique vectors, row of each input text, stats
+        with candidates / unique / encodes_saved / model_encodes, the last
+        being what reached the model after an EmbeddingCache's tiers)
+    """
+    normalize = getattr(encoder, "normalize", normalize_skill)
+    keys = [normalize(text) for text in texts]
+    unique = list(dict.fromkeys(keys))
+    row_of = {key: i for i, key in enumerate(unique)}
+    model_encodes = len(unique)
+    if not unique:
+        vectors = np.zeros((0, 0), dtype=np.float32)
+    elif hasattr(encoder, "encode_with_stats"):
+        vectors, call = encoder.encode_with_stats(unique, batch_size=batch_size)
+        vectors = _normalize_rows(vectors)
+        model_encodes = call["misses"]
+    else:
+        vectors = _normalize_rows(encoder.encode(unique, batch_size=batch_size))
+    stats = {"candidates": len(texts), "unique": len(unique), "encodes_saved": len(texts) - len(unique),
+             "model_encodes": model_encodes}
+    return vectors, np.array([row_of[key] for key in keys], dtype=np.int64), stats
+
+
+def classify(scores: np.ndarray, strong: float = STRONG_THRESHOLD,
+             partial: float = PARTIAL_THRESHOLD) -> np.ndarray:
+    return np.select([scores >= strong, scores >= partial], ["Strong", "Partial"], "Missing")
+
+
+def _resume_blocks(resume_offsets: np.ndarray, block_cols: int) -> Iterator[Tuple[int, int]]:
+    """
+    Yields [start, end) resume ranges holding at most `block_cols` skills
+    (or a single resume, if it alone has more), so whole resumes stay in
+    one block and each segment is reduced in one go.
+    """
+    n_resumes = len(resume_offsets) - 1
+    resume_start = 0
+    while resume_start < n_resumes:
+        resume_end = resume_start + 1
+        while resume_end < n_resumes and \
+                resume_offsets[resume_end + 1] - resume_offsets[resume_start] <= block_cols:
+            resume_end += 1
+        yield resume_start, resume_end
+        resume_start = resume_end
+
+
+def _block_best(jd_vectors: np.ndarray, resume_vectors: np.ndarray, resume_columns: np.ndarray,
+                resume_offsets: np.ndarray, resume_start: int, resume_end: int,
+                block_rows: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns:
+        tuple: (scores, skill ids), both (J, resume_end - resume_start)
+    """
+    scores = np.full((len(jd_vectors), resume_end - resume_start), -np.inf, dtype=np.float32)
+    matches = np.full(scores.shape, -1, dtype=np.int64)
+    block_resumes = np.arange(resume_start, resume_end)
+    block_resumes = block_resumes[np.diff(resume_offsets[resume_start:resume_end + 1]) > 0]
+    if not len(block_resumes):
+        return scores, matches
+
+    col_start = resume_offsets[block_resumes[0]]
+    col_end = resume_offsets[block_resumes[-1] + 1]
+    columns = resume_columns[col_start:col_end]
+    starts = resume_offsets[block_resumes] - col_start
+    column_vectors = resume_vectors[columns]
+    positions = np.arange(len(columns))
+    segment_of = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(columns))))
+    targets = block_resumes - resume_start
+
+    for row_start in range(0, len(jd_vectors), block_rows):
+        rows = slice(row_start, row_start + block_rows)
+        block = jd_vectors[rows] @ column_vectors.T
+        # Empty resumes were dropped above, so every segment is non-empty
+        best = np.maximum.reduceat(block, starts, axis=1)
+        first = np.minimum.reduceat(
+            np.where(block == best[:, segment_of], positions, len(columns)), starts, axis=1
+        )
+        scores[rows, targets] = best
+        matches[rows, targets] = columns[first]
+    return scores, matches
+
+
+def best_matches(jd_vectors: np.ndarray, resume_vectors: np.ndarray, resume_columns: np.ndarray,
+                 resume_offsets: np.ndarray, block_rows: int = 1024,
+                 block_cols: int = 8192) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    For every JD skill and every resume, the best cosine score among that
+    resume's skills and which skill it was. The result itself is J x N; use
+    iter_gap_frames() when that does not fit in memory.
+
+    Args:
+        jd_vectors: (J, d) normalized vectors of the distinct JD skills
+        resume_vectors: (U, d) normalized vectors of the distinct resume skills
+        resume_columns: Flattened skill ids (rows of resume_vectors), resume by resume
+        resume_offsets: (N + 1,) start of each resume's run in resume_columns
+
+    Returns:
+        tuple: (scores, skill ids), both (J, N); -inf / -1 for a resume
+        without skills
+    """
+    n_resumes = len(resume_offsets) - 1
+    scores = np.full((len(jd_vectors), n_resumes), -np.inf, dtype=np.float32)
+    matches = np.full((len(jd_vectors), n_resumes), -1, dtype=np.int64)
+    for resume_start, resume_end in _resume_blocks(resume_offsets, block_cols):
+        scores[:, resume_start:resume_end], matches[:, resume_start:resume_end] = _block_best(
+            jd_vectors, resume_vectors, resume_columns, resume_offsets, resume_start, resume_end, block_rows
+        )
+    return scores, matches
+
+
+def iter_gap_frames(resumes: Dict[str, Sequence[str]], jds: Dict[str, Sequence[str]], encoder,
+                    strong: float = STRONG_THRESHOLD, partial: float = PARTIAL_THRESHOLD,
+                    block_rows: int = 1024, block_cols: int = 8192,
+                    batch_size: int = ENCODE_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Yields the gap table in chunks, one per JD and block of resumes (at most
+    `block_cols` resume skills), in the same row order as gap_table(). Each
+    (resume, JD) pair lies in a single chunk, and every chunk's
+    `attrs["encoding"]` holds the encode_unique() stats.
+
+    Args:
+        resumes: resume id -> skills
+        jds: JD id -> skills
+        encoder: SentenceTransformer or EmbeddingCache (anything with encode)
+    """
+    jd_skill_lists = {jd: list(dict.fromkeys(skills)) for jd, skills in jds.items()}
+    resume_skill_lists = {r: list(dict.fromkeys(skills)) for r, skills in resumes.items()}
+    vocabulary = list(dict.fromkeys(
+        [s for skills in jd_skill_lists.values() for s in skills]
+        + [s for skills in resume_skill_lists.values() for s in skills]
+    ))
+    if not vocabulary or not jd_skill_lists or not resume_skill_lists:
+        return
+    vocab_index = {skill: i for i, skill in enumerate(vocabulary)}
+    # Every mention from both sides goes through one deduplicated encode call
+    mentions = [s for skills in jds.values() for s in skills] + [s for skills in resumes.values() for s in skills]
+    unique_vectors, rows, encoding = encode_unique(encoder, mentions, batch_size)
+    row_of = dict(zip(mentions, rows))
+    vectors = unique_vectors[[row_of[skill] for skill in vocabulary]]
+
+    resume_columns = np.array([vocab_index[s] for skills in resume_skill_lists.values() for s in skills],
+                              dtype=np.int64)
+    resume_offsets = np.zeros(len(resume_skill_lists) + 1, dtype=np.int64)
+    np.cumsum([len(skills) for skills in resume_skill_lists.values()], out=resume_offsets[1:])
+    blocks = list(_resume_blocks(resume_offsets, block_cols))
+
+    # Tidy layout: for each JD, resume-major then JD skill order
+    resume_ids = np.array(list(resume_skill_lists), dtype=object)
+    vocab_array = np.array(vocabulary + ["-"], dtype=object)   # id -1 (no match) -> "-"
+    for jd, skills in jd_skill_lists.items():
+        if not skills:
+            continue
+        jd_vectors = vectors[[vocab_index[s] for s in skills]]
+        skill_array = np.array(skills, dtype=object)
+        for resume_start, resume_end in blocks:
+            scores, matches = _block_best(jd_vectors, vectors, resume_columns, resume_offsets,
+                                          resume_start, resume_end, block_rows)
+            jd_scores = scores.T.ravel()
+            status = classify(jd_scores, strong, partial)
+            jd_matches = np.where(status == "Missing", -1, matches.T.ravel())
+            frame = pd.DataFrame({
+                "Resume": np.repeat(resume_ids[resume_start:resume_end], len(skills)),
+                "JD": jd,
+                "JD Skill": np.tile(skill_array, resume_end - resume_start),
+                "Resume Match": vocab_array[jd_matches],
+                "Similarity": np.round(np.where(np.isfinite(jd_scores), jd_scores, 0.0), 3),
+                "Status": status,
+            })
+            frame.attrs["encoding"] = encoding
+            yield frame
+
+
+def gap_table(resumes: Dict[str, Sequence[str]], jds: Dict[str, Sequence[str]], encoder,
+              strong: float = STRONG_THRESHOLD, partial: float = PARTIAL_THRESHOLD,
+              block_rows: int = 1024, block_cols: int = 8192,
+              batch_size: int = ENCODE_BATCH_SIZE) -> pd.DataFrame:
+    """
+    All of iter_gap_frames() in one DataFrame, so its size is N x M x JD
+    skills rows; use iter_gap_frames() directly for large batches.
+
+    Returns:
+        pd.DataFrame: One row per (resume, JD, JD skill) with the best
+        resume match, its similarity and the Strong/Partial/Missing status.
+        `table.attrs["encoding"]` holds the encode_unique() stats.
+    """
+    frames = list(iter_gap_frames(resumes, jds, encoder, strong, partial, block_rows, block_cols, batch_size))
+    if not frames:
+        return pd.DataFrame(columns=COLUMNS)
+    table = pd.concat(frames, ignore_index=True)
+    table.attrs["encoding"] = frames[0].attrs["encoding"]
+    return table
+
+
+def summarize(table: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns:
+        pd.DataFrame: Per (resume, JD) status counts and coverage, the share
+        of JD skills that are Strong or Partial, best first
+    """
+    counts = pd.crosstab([table["Resume"], table["JD"]], table["Status"])
+    for status in ("Strong", "Partial", "Missing"):
+        if status not in counts:
+            counts[status] = 0
+    counts = counts[["Strong", "Partial", "Missing"]]
+    counts.columns.name = None
+    counts["Coverage"] = ((counts["Strong"] + counts["Partial"]) / counts.sum(axis=1)).round(3)
+    return counts.reset_index().sort_values(["JD", "Coverage"], ascending=[True, False])
+
+
+def write_report(frames: Iterator[pd.DataFrame], output: str,
+                 summary: Optional[str] = None) -> Tuple[int, dict]:
+    """
+    Streams iter_gap_frames() chunks to a CSV, one chunk in memory at a time.
+    With `summary`, also writes summarize() of every chunk; each (resume, JD)
+    pair lies in a single chunk, so the per-chunk counts are complete.
+
+    Returns:
+        tuple: (rows written, encode_unique() stats)
+    """
+    rows = 0
+    encoding = {}
+    summaries = []
+    with open(output, "w", encoding="utf-8", newline="") as f:
+        for frame in frames:
+            frame.to_csv(f, index=False, header=not rows)
+            rows += len(frame)
+            encoding = frame.attrs.get("encoding", encoding)
+            if summary:
+                summaries.append(summarize(frame))
+        if not rows:
+            pd.DataFrame(columns=COLUMNS).to_csv(f, index=False)
+    if summary:
+        coverage = pd.concat(summaries, ignore_index=True) if summaries else summarize(pd.DataFrame(columns=COLUMNS))
+        coverage.sort_values(["JD", "Coverage"], ascending=[True, False]).to_csv(summary, index=False)
+    return rows, encoding
+
+
+def load_jsonl(path: str) -> Dict[str, List[str]]:
+    with open(path, "r", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return {str(record["id"]): record["skills"] for record in records}
+
+
+if __name__ == "__main__":
+    import argparse
+    import os
+    import sys
+    import time
+
+    from sentence_transformers import SentenceTransformer
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "../Task-4"))
+    from embedding_cache import EmbeddingCache
+
+    parser = argparse.ArgumentParser(description="Skill gap report for every resume x JD pair")
+    parser.add_argument("resumes", help='JSONL of {"id": ..., "skills": [...]}')
+    parser.add_argument("jds", help='JSONL of {"id": ..., "skills": [...]}')
+    parser.add_argument("-o", "--output", default="gap_report.csv")
+    parser.add_argument("--summary", help="also write per-pair coverage to this CSV")
+    parser.add_argument("--model", default="all-MiniLM-L6-v2")
+    parser.add_argument("--block-rows", type=int, default=1024)
+    parser.add_argument("--block-cols", type=int, default=8192)
+    args = parser.parse_args()
+
+    resumes, jds = load_jsonl(args.resumes), load_jsonl(args.jds)
+    encoder = EmbeddingCache(SentenceTransformer(args.model), args.model)
+    start = time.perf_counter()
+    frames = iter_gap_frames(resumes, jds, encoder, block_rows=args.block_rows, block_cols=args.block_cols)
+    rows, encoding = write_report(frames, args.output, args.summary)
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(resumes)} resumes x {len(jds)} JDs -> {rows} rows in {elapsed:.2f}s ({args.output})")
+    print(f"   {encoding.get('candidates', 0)} skill mentions, {encoding.get('unique', 0)} encoded, "
+          f"{encoding.get('encodes_saved', 0)} encodes saved by deduplication")
@@ -1,19 +1,31 @@
+import os
+import sys
+
 import streamlit as st
-import pandas as pd
 import spacy
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from gap_engine import gap_table
+
+# Shared embedding helpers live with the Task-4 similarity app
+sys.path.append(os.path.join(os.path.dirname(__file__), "../Task-4"))
+from embedding_backends import BACKENDS, backend_key, int8_available, load_backend
+from embedding_cache import EmbeddingCache
 
 # ------------------------------
 # 1. Load models
 # ------------------------------
+backend = st.sidebar.selectbox("Embedding backend", BACKENDS)
+if backend == "int8" and not int8_available():
+    st.sidebar.warning("⚠️ No int8 model exported yet (Task-4/embedding_backends.py export); using float32.")
+    backend = "float32"
+
 @st.cache_resource
-def load_models():
+def load_models(backend):
     nlp = spacy.load("en_core_web_sm")
-    sbert = SentenceTransformer("all-MiniLM-L6-v2")
+    sbert = EmbeddingCache(load_backend(backend), backend_key(backend))
     return nlp, sbert
 
-nlp, sbert_model = load_models()
+nlp, sbert_model = load_models(backend)
 
 # ------------------------------
 # 2. Extract skills (rule-based + NER)
@@ -42,36 +54,17 @@ if st.button("Generate Report"):
         resume_skills = extract_skills(resume_text)
         jd_skills = extract_skills(jd_text)
 
-        # Embeddings + similarity
-        resume_emb = sbert_model.encode(resume_skills)
-        jd_emb = sbert_model.encode(jd_skills)
-        sim_matrix = cosine_similarity(jd_emb, resume_emb)
-
-        results = []
-        for i, jd_skill in enumerate(jd_skills):
-            sims = list(enumerate(sim_matrix[i]))
-            sims = sorted(sims, key=lambda x: x[1], reverse=True)
-            best_idx, best_score = sims[0]
-            resume_match = resume_skills[best_idx]
-
-            if best_score >= 0.75:
-                status = "Strong"
-            elif best_score >= 0.5:
-                status = "Partial"
-            else:
-                status = "Missing"
-                resume_match = "-"
-
-            results.append({
-                "JD Skill": jd_skill,
-                "Resume Match": resume_match,
-                "Status": status
-            })
-
-        df = pd.DataFrame(results)
+        # Embeddings + similarity (one resume x one JD through the batch engine)
+        report = gap_table({"resume": resume_skills}, {"jd": jd_skills}, sbert_model)
+        df = report[["JD Skill", "Resume Match", "Status"]]
+        encoding = report.attrs.get("encoding", {})
 
         st.subheader("📑 Skill Gap Report")
         st.dataframe(df)
+        if encoding:
+            st.caption(f"🧮 {encoding['candidates']} skill strings → {encoding['unique']} unique in one "
+                       f"encode call ({encoding['encodes_saved']} encodes saved by deduplication, "
+                       f"{encoding['model_encodes']} sent to the model after the embedding cache).")
 
         # Download button
         csv = df.to_csv(index=False).encode("utf-8")
@@ -2,7 +2,8 @@ import streamlit as st
 import json
 import pandas as pd
 from io import BytesIO
-import re
+import os
+import sys
 from collections import Counter
 
 # Check for plotly availability
@@ -14,6 +15,12 @@ except ImportError:
     PLOTLY_AVAILABLE = False
     st.warning("⚠️ Plotly not installed. Visualizations will use Streamlit native charts. Install with: pip install plotly")
 
+# Aho–Corasick skill matcher shared with M-1 Task-2: one pass per text,
+# independent of the database size
+sys.path.append(os.path.join(os.path.dirname(__file__), "../../M-1-Tasks/Task-2"))
+from skill_automaton import load_or_build
+AUTOMATON_FILE = os.path.join(os.path.dirname(__file__), "skill_database.ac")
+
 # Initialize session state
 if 'extracted_skills' not in st.session_state:
     st.session_state['extracted_skills'] = None
@@ -100,56 +107,33 @@ SKILL_RELATIONSHIPS = {
 }
 
 
-def fuzzy_match_skill(text_lower, skill, threshold=0.85):
-    """Simple fuzzy matching based on substring and similarity"""
-    skill_lower = skill.lower()
-    
-    # Exact match
-    if skill_lower in text_lower:
-        return True
-    
-    # Check synonyms
-    if skill in SYNONYMS:
-        for synonym in SYNONYMS[skill]:
-            if synonym.lower() in text_lower:
-                return True
-    
-    # Check if skill is mentioned with version numbers or variations
-    pattern = re.escape(skill_lower) + r'[\d\.\s]*'
-    if re.search(pattern, text_lower):
-        return True
-    
-    return False
+@st.cache_resource
+def get_skill_automaton(skill_database):
+    """Compiles skills and their synonyms; synonyms report the skill they stand for"""
+    entries = [(skill, skill) for skills in skill_database.values() for skill in skills]
+    entries += [(synonym, skill) for skill, synonyms in SYNONYMS.items() for synonym in synonyms]
+    return load_or_build(AUTOMATON_FILE, entries)
 
 
 def extract_skills(text, skill_database):
-    """Enhanced skill extraction with fuzzy matching and context"""
-    text_lower = text.lower()
+    """Single-pass skill extraction with synonyms, version suffixes (python3) and context"""
+    mentions = {}
+    for match in get_skill_automaton(skill_database).iter_matches(text, allow_version=True):
+        # Keep the last mention of each skill as its context
+        mentions[match.canonical] = match
+    
     found_skills = {}
     skill_contexts = {}
     all_skills = []
-    
     for category, skills in skill_database.items():
-        found_in_category = []
-        contexts = {}
-        
-        for skill in skills:
-            if fuzzy_match_skill(text_lower, skill):
-                found_in_category.append(skill)
-                all_skills.append(skill)
-                
-                # Extract context (surrounding words)
-                skill_pattern = re.escape(skill.lower())
-                matches = re.finditer(skill_pattern, text_lower)
-                for match in matches:
-                    start = max(0, match.start() - 50)
-                    end = min(len(text), match.end() + 50)
-                    context = text[start:end].strip()
-                    contexts[skill] = context
-        
+        found_in_category = [skill for skill in skills if skill in mentions]
         if found_in_category:
             found_skills[category] = found_in_category
-            skill_contexts[category] = contexts
+            skill_contexts[category] = {
+                skill: text[max(0, mentions[skill].start - 50):mentions[skill].end + 50].strip()
+                for skill in found_in_category
+            }
+            all_skills.extend(found_in_category)
     
     return found_skills, skill_contexts, all_skills
 